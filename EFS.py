@@ -1,10 +1,18 @@
 import os
-import requests
+import asyncio
+import tempfile
+import bisect
+import heapq
+import re
+import time
+import aiohttp
+import orjson
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-import pytz
+from zoneinfo import ZoneInfo
 import collections
 import streamlit as st
+import numpy as np
 import pandas as pd
 
 # Load environment variables from .env file
@@ -74,24 +82,43 @@ OPENMETEO_KEY = os.getenv("OPENMETEO_API_KEY")
 TOMORROWIO_KEY = os.getenv("TOMORROW_API_KEY")
 ACCUWEATHER_KEY = os.getenv("ACCUWEATHER_API_KEY")
 
-# Mine locations with coordinates and AccuWeather location keys
-MINE_LOCATIONS = [
-    {"name": os.getenv("NAME1"), "lat": float(os.getenv("LAT1")), "lon": float(os.getenv("LON1")), 
-     "accuweather_location_key": os.getenv("LOCATION_KEY1")},
-    {"name": os.getenv("NAME2"), "lat": float(os.getenv("LAT2")), "lon": float(os.getenv("LON2")), 
-     "accuweather_location_key": os.getenv("LOCATION_KEY2")},
-    {"name": os.getenv("NAME3"), "lat": float(os.getenv("LAT3")), "lon": float(os.getenv("LON3")), 
-     "accuweather_location_key": os.getenv("LOCATION_KEY3")},
-    {"name": os.getenv("NAME4"), "lat": float(os.getenv("LAT4")), "lon": float(os.getenv("LON4")), 
-     "accuweather_location_key": os.getenv("LOCATION_KEY4")},
-    {"name": os.getenv("NAME5"), "lat": float(os.getenv("LAT5")), "lon": float(os.getenv("LON5")), 
-     "accuweather_location_key": os.getenv("LOCATION_KEY5")},
-]
+# Mine locations are read from NAME{i}/LAT{i}/LON{i}/LOCATION_KEY{i} env vars
+MAX_MINE_SLOTS = 5
+
+
+def _parse_mine_location(index):
+    """Read one mine's env vars; returns None if the entry is missing or malformed"""
+    name = os.getenv(f"NAME{index}")
+    lat = os.getenv(f"LAT{index}")
+    lon = os.getenv(f"LON{index}")
+    if not name or lat is None or lon is None:
+        return None
+    try:
+        return {"name": name, "lat": float(lat), "lon": float(lon),
+                "accuweather_location_key": os.getenv(f"LOCATION_KEY{index}")}
+    except ValueError:
+        return None
+
+
+@st.cache_resource
+def get_mine_locations():
+    """Mine locations with coordinates and AccuWeather location keys, parsed once per process"""
+    return [m for m in (_parse_mine_location(i) for i in range(1, MAX_MINE_SLOTS + 1)) if m]
 
 # Timezone definitions
-IST = pytz.timezone('Asia/Kolkata')
-UTC = pytz.utc
+IST = ZoneInfo('Asia/Kolkata')
+UTC = ZoneInfo('UTC')
 REQUEST_TIMEOUT = 10
+BULK_FETCH_TIMEOUT = 30
+MAX_CONCURRENT_FETCHES = 8
+CACHE_TTL_SECONDS = 1800
+# Per-API freshness windows: hourly feeds refresh every 10-15 min at the
+# source, while AccuWeather's 5-day daily forecast only updates a few times
+# a day — a long TTL there halves quota usage without hurting freshness.
+OPENWEATHER_CACHE_TTL = 600
+OPEN_METEO_CACHE_TTL = 900
+TOMORROW_IO_CACHE_TTL = 900
+ACCUWEATHER_CACHE_TTL = 6 * 3600
 
 # Threshold values for alerts
 WIND_ALERT_THRESHOLD_KMH = 30
@@ -99,57 +126,96 @@ VISIBILITY_ALERT_THRESHOLD_KM = 1.0
 MIN_RAINFALL_FOR_SLAB_DISPLAY_MM = 0.6
 MAX_SLABS_TO_SHOW = 6
 
+# 2-hour display slabs, in chronological order (used for final sorting too)
+SLAB_DEFINITIONS = [
+    (0, 2, "12:30 AM to 02:30 AM"), (2, 4, "02:30 AM to 04:30 AM"),
+    (4, 6, "04:30 AM to 06:30 AM"), (6, 8, "06:30 AM to 08:30 AM"),
+    (8, 10, "08:30 AM to 10:30 AM"), (10, 12, "10:30 AM to 12:30 PM"),
+    (12, 14, "12:30 PM to 02:30 PM"), (14, 16, "02:30 PM to 04:30 PM"),
+    (16, 18, "04:30 PM to 06:30 PM"), (18, 20, "06:30 PM to 08:30 PM"),
+    (20, 22, "08:30 PM to 10:30 PM"), (22, 2, "10:30 PM to 12:30 AM (Next Day)"),
+]
+
+SLAB_ORDER_MAP = {s[2]: idx for idx, s in enumerate(SLAB_DEFINITIONS)}
+
+
+def _hour_to_slab(hour):
+    """Map an hour of day to its 2-hour slab by integer division.
+
+    Slabs are laid out at even hours, so ``hour // 2`` indexes straight into
+    SLAB_DEFINITIONS; only the 10:30 PM wrap slab needs a special case.
+    """
+    return SLAB_DEFINITIONS[11 if hour >= 22 else hour >> 1]
+
+# Prototype for a per-slab accumulator; copied once per slab per day instead of
+# invoking a defaultdict factory lambda on every miss.
+_EMPTY_SLAB_BUCKET = {
+    "rain_mm": 0.0, "pop_sum": 0.0, "wind_sum": 0.0, "vis_sum": 0.0,
+    "has_lightning": False, "has_thunder_desc": False, "hours_covered": 0
+}
+
+# One C-level regex scan classifies a weather description instead of five
+# Python substring searches; keyword -> display label
+_DESC_RE = re.compile(r'(thunderstorm|storm|clear|sun|cloud|overcast|fog|mist|rain)', re.IGNORECASE)
+_DESC_MAP = {
+    'thunderstorm': "Thunderstorm ⚡", 'storm': "Thunderstorm ⚡",
+    'clear': "Sunny ☀️", 'sun': "Sunny ☀️",
+    'cloud': "Cloudy ☁️", 'overcast': "Cloudy ☁️",
+    'fog': "Foggy 🌫️", 'mist': "Foggy 🌫️",
+    'rain': "Rainy ☔",
+}
+
+# Monotonic rainfall tiers resolved with bisect instead of if/elif ladders.
+# Label index = bisect_right(thresholds, mm); mm == 0 is handled separately.
+_SLAB_RAIN_TIERS = ((0.3, 1.5, 5.0, 8.0),
+                    ("drizzle", "light rain", "moderate rain", "heavy rain",
+                     "very heavy rain (torrential)"))
+_DAILY_RAIN_TIERS = ((1.0, 5.0, 15.0, 25.0),
+                     ("Drizzle 💧", "Light Rain 🌦️", "Moderate Rain ☔",
+                      "Heavy Rain 🌧️", "Very Heavy Rain & Storm ⛈️"))
+_RAIN_IMPACT_TIERS = ((5.0, 15.0), (
+    ("Low", "Normal operations, minor impact possible"),
+    ("Moderate", "Proceed with caution, production may be impacted due to moderate rainfall."),
+    ("High", "Production may be significantly impacted due to heavy rainfall."),
+))
+
 
 def get_rain_type(mm, is_2hr_slab=False, overall_description=None):
     """Categorize rainfall amount into descriptive types with icons"""
     if is_2hr_slab:
-        if mm >= 8: return "very heavy rain (torrential)"
-        elif mm >= 5: return "heavy rain"
-        elif mm >= 1.5: return "moderate rain"
-        elif mm >= 0.3: return "light rain"
-        elif mm > 0: return "drizzle"
-        else: return "no rain"
+        if mm <= 0:
+            return "no rain"
+        thresholds, labels = _SLAB_RAIN_TIERS
+        return labels[bisect.bisect_right(thresholds, mm)]
     else:
-        if mm >= 25: return "Very Heavy Rain & Storm ⛈️"
-        elif mm >= 15: return "Heavy Rain 🌧️"
-        elif mm >= 5: return "Moderate Rain ☔"
-        elif mm >= 1: return "Light Rain 🌦️"
-        elif mm > 0: return "Drizzle 💧"
+        if mm > 0:
+            thresholds, labels = _DAILY_RAIN_TIERS
+            return labels[bisect.bisect_right(thresholds, mm)]
         else:
             if overall_description:
-                desc_lower = overall_description.lower()
-                if "clear" in desc_lower or "sun" in desc_lower: return "Sunny ☀️"
-                elif "cloud" in desc_lower or "overcast" in desc_lower: return "Cloudy ☁️"
-                elif "fog" in desc_lower or "mist" in desc_lower: return "Foggy 🌫️"
-                elif "thunderstorm" in desc_lower or "storm" in desc_lower: return "Thunderstorm ⚡"
-                elif "rain" in desc_lower: return "Rainy ☔"
+                match = _DESC_RE.search(overall_description)
+                if match:
+                    return _DESC_MAP[match.group(1).lower()]
             return "No Rain ☀️"
 
 
 def get_production_status(total_rain_mm, slabs):
     """Determine mining production impact based on rainfall and hazardous conditions"""
-    impact_level = "Low"
-    status_msg = "Normal operations, minor impact possible"
-    
-    if total_rain_mm >= 15:
-        impact_level = "High"
-        status_msg = "Production may be significantly impacted due to heavy rainfall."
-    elif total_rain_mm >= 5:
-        impact_level = "Moderate"
-        status_msg = "Proceed with caution, production may be impacted due to moderate rainfall."
+    thresholds, tiers = _RAIN_IMPACT_TIERS
+    impact_level, status_msg = tiers[bisect.bisect_right(thresholds, total_rain_mm)]
     
     has_lightning = False
     has_high_wind = False
     has_low_visibility = False
     
     for slab in slabs:
-        if slab['lightning']:
-            has_lightning = True
-        if slab['wind_speed'] >= WIND_ALERT_THRESHOLD_KMH:
-            has_high_wind = True
-        if slab['visibility_km'] <= VISIBILITY_ALERT_THRESHOLD_KM:
-            has_low_visibility = True
-    
+        has_lightning = has_lightning or slab['lightning']
+        has_high_wind = has_high_wind or slab['wind_speed'] >= WIND_ALERT_THRESHOLD_KMH
+        has_low_visibility = has_low_visibility or slab['visibility_km'] <= VISIBILITY_ALERT_THRESHOLD_KM
+        if has_lightning and has_high_wind and has_low_visibility:
+            # All three hazards already flagged; no later slab can change the outcome.
+            break
+
     if has_lightning:
         if impact_level != "High":
             impact_level = "High"
@@ -177,103 +243,151 @@ def get_production_status(total_rain_mm, slabs):
 def utc_to_ist(utc_dt):
     """Convert UTC datetime to IST timezone"""
     if utc_dt.tzinfo is None:
-        utc_dt = UTC.localize(utc_dt)
+        utc_dt = utc_dt.replace(tzinfo=UTC)
     return utc_dt.astimezone(IST)
 
 
+# Open-Meteo WMO weather codes -> readable descriptions (module scope so the
+# vectorized ingestion can .map() it directly)
+OPEN_METEO_WMO_CODES = {
+    0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+    45: "Fog", 48: "Depositing rime fog",
+    51: "Drizzle: Light", 53: "Drizzle: Moderate", 55: "Drizzle: Dense",
+    56: "Freezing Drizzle: Light", 57: "Freezing Drizzle: Dense",
+    61: "Rain: Light", 63: "Rain: Moderate", 65: "Rain: Heavy",
+    66: "Freezing Rain: Light", 67: "Freezing Rain: Heavy",
+    71: "Snow fall: Slight", 73: "Snow fall: Moderate", 75: "Snow fall: Heavy",
+    77: "Snow grains",
+    80: "Rain showers: Slight", 81: "Rain showers: Moderate", 82: "Rain showers: Violent",
+    85: "Snow showers: Slight", 86: "Snow showers: Heavy",
+    95: "Thunderstorm: Slight or moderate",
+    96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
+}
+
+# Tomorrow.io weather codes -> readable descriptions
+TOMORROW_IO_WEATHER_CODES = {
+    0: "Unknown", 1000: "Clear, Sunny", 1001: "Cloudy", 1100: "Mostly Clear",
+    1101: "Partly Cloudy", 1102: "Mostly Cloudy", 2000: "Fog", 2100: "Light Fog",
+    3000: "Light Wind", 3001: "Wind", 3002: "Strong Wind", 4000: "Drizzle",
+    4001: "Rain", 4200: "Light Rain", 4201: "Heavy Rain", 5000: "Light Snow",
+    5001: "Snow", 5100: "Heavy Snow", 5101: "Freezing Drizzle",
+    6000: "Freezing Drizzle", 6001: "Freezing Rain", 6200: "Light Freezing Rain",
+    6201: "Heavy Freezing Rain", 7000: "Light Ice Pellets", 7001: "Ice Pellets",
+    7100: "Heavy Ice Pellets", 8000: "Thunderstorm"
+}
+
+# Open-Meteo WMO thunderstorm codes
+OPEN_METEO_LIGHTNING_CODES = (95, 96, 99)
+
+
 def get_weather_description_from_wmo_open_meteo(code):
     """Map Open-Meteo WMO weather codes to readable descriptions"""
-    weather_codes = {
-        0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-        45: "Fog", 48: "Depositing rime fog",
-        51: "Drizzle: Light", 53: "Drizzle: Moderate", 55: "Drizzle: Dense",
-        56: "Freezing Drizzle: Light", 57: "Freezing Drizzle: Dense",
-        61: "Rain: Light", 63: "Rain: Moderate", 65: "Rain: Heavy",
-        66: "Freezing Rain: Light", 67: "Freezing Rain: Heavy",
-        71: "Snow fall: Slight", 73: "Snow fall: Moderate", 75: "Snow fall: Heavy",
-        77: "Snow grains",
-        80: "Rain showers: Slight", 81: "Rain showers: Moderate", 82: "Rain showers: Violent",
-        85: "Snow showers: Slight", 86: "Snow showers: Heavy",
-        95: "Thunderstorm: Slight or moderate",
-        96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
-    }
-    return weather_codes.get(code, "Unknown")
+    return OPEN_METEO_WMO_CODES.get(code, "Unknown")
 
 
 def get_weather_description_from_wmo_tomorrow_io(code):
     """Map Tomorrow.io weather codes to readable descriptions"""
-    tomorrow_io_weather_codes = {
-        0: "Unknown", 1000: "Clear, Sunny", 1001: "Cloudy", 1100: "Mostly Clear",
-        1101: "Partly Cloudy", 1102: "Mostly Cloudy", 2000: "Fog", 2100: "Light Fog",
-        3000: "Light Wind", 3001: "Wind", 3002: "Strong Wind", 4000: "Drizzle",
-        4001: "Rain", 4200: "Light Rain", 4201: "Heavy Rain", 5000: "Light Snow",
-        5001: "Snow", 5100: "Heavy Snow", 5101: "Freezing Drizzle",
-        6000: "Freezing Drizzle", 6001: "Freezing Rain", 6200: "Light Freezing Rain",
-        6201: "Heavy Freezing Rain", 7000: "Light Ice Pellets", 7001: "Ice Pellets",
-        7100: "Heavy Ice Pellets", 8000: "Thunderstorm"
-    }
-    return tomorrow_io_weather_codes.get(code, "Unknown")
+    return TOMORROW_IO_WEATHER_CODES.get(code, "Unknown")
+
+
+# In-process TTL cache for raw API payloads. @st.cache_data cannot wrap
+# coroutines, so the async fetchers share this simple (key -> timestamp, json)
+# store instead — same 30 min freshness window as before.
+_api_cache = {}
+
+# Optional on-disk second tier: survives process restarts, so a redeploy or a
+# new worker does not re-fetch payloads that are still inside their TTL.
+try:
+    import diskcache
+    _DISK_CACHE = diskcache.Cache(os.path.join(tempfile.gettempdir(), "efs_forecast_cache"))
+except Exception:
+    _DISK_CACHE = None
+
+
+def _cache_get(key, ttl=CACHE_TTL_SECONDS):
+    hit = _api_cache.get(key)
+    if hit and time.time() - hit[0] < ttl:
+        return hit[1]
+    if _DISK_CACHE is not None:
+        value = _DISK_CACHE.get(key)
+        if value is not None:
+            _api_cache[key] = (time.time(), value)
+            return value
+    return None
+
+
+def _cache_put(key, value, ttl=CACHE_TTL_SECONDS):
+    _api_cache[key] = (time.time(), value)
+    if _DISK_CACHE is not None:
+        try:
+            _DISK_CACHE.set(key, value, expire=ttl)
+        except Exception:
+            pass
+
+
+async def _fetch_json(session, cache_key, url, ttl=CACHE_TTL_SECONDS):
+    """GET a URL through the shared session, with TTL caching of the JSON body"""
+    cached = _cache_get(cache_key, ttl)
+    if cached is not None:
+        return cached
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+    _cache_put(cache_key, data, ttl)
+    return data
 
 
-@st.cache_data(ttl=1800)
-def fetch_openweather_forecast(lat, lon):
-    """Fetch hourly weather forecast from OpenWeatherMap (cached for 30 min)"""
+async def fetch_openweather_forecast(session, lat, lon):
+    """Fetch hourly weather forecast from OpenWeatherMap (cached for 10 min)"""
     if not OPENWEATHER_KEY:
         return None
-    
-    try:
-        url = (f"https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}"
-               f"&units=metric&exclude=minutely,daily,alerts&appid={OPENWEATHER_KEY}")
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException:
-        return None
 
+    url = (f"https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}"
+           f"&units=metric&exclude=minutely,daily,alerts&appid={OPENWEATHER_KEY}")
+    return await _fetch_json(session, ("openweather", lat, lon), url, OPENWEATHER_CACHE_TTL)
 
-@st.cache_data(ttl=1800)
-def fetch_open_meteo_forecast(lat, lon):
-    """Fetch hourly weather forecast from Open-Meteo (cached for 30 min)"""
-    try:
-        url = (f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}"
-               f"&hourly=temperature_2m,precipitation,weather_code,wind_speed_10m,precipitation_probability,visibility"
-               f"&forecast_days=2&timezone=Asia%2FKolkata")
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException:
-        return None
+
+async def fetch_open_meteo_forecast(session, lat, lon):
+    """Fetch hourly weather forecast from Open-Meteo (cached for 15 min)"""
+    url = (f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}"
+           f"&hourly=temperature_2m,precipitation,weather_code,wind_speed_10m,precipitation_probability,visibility"
+           f"&forecast_days=2&timezone=Asia%2FKolkata")
+    return await _fetch_json(session, ("open_meteo", lat, lon), url, OPEN_METEO_CACHE_TTL)
 
 
-@st.cache_data(ttl=1800)
-def fetch_tomorrow_io_forecast(lat, lon):
-    """Fetch weather forecast from Tomorrow.io (cached for 30 min)"""
+async def fetch_tomorrow_io_forecast(session, lat, lon):
+    """Fetch weather forecast from Tomorrow.io (cached for 15 min)"""
     if not TOMORROWIO_KEY:
         return None
-    
-    try:
-        url = (f"https://api.tomorrow.io/v4/weather/forecast?location={lat},{lon}"
-               f"&units=metric&apikey={TOMORROWIO_KEY}")
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException:
-        return None
 
+    url = (f"https://api.tomorrow.io/v4/weather/forecast?location={lat},{lon}"
+           f"&units=metric&apikey={TOMORROWIO_KEY}")
+    return await _fetch_json(session, ("tomorrow_io", lat, lon), url, TOMORROW_IO_CACHE_TTL)
 
-@st.cache_data(ttl=1800)
-def fetch_accuweather_daily_forecast(location_key):
-    """Fetch daily weather forecast from AccuWeather (cached for 30 min)"""
+
+async def fetch_accuweather_daily_forecast(session, location_key):
+    """Fetch daily weather forecast from AccuWeather (cached for 6 h; it only updates a few times a day)"""
     if not ACCUWEATHER_KEY or not location_key:
         return None
-    
-    try:
-        url = f"https://dataservice.accuweather.com/forecasts/v1/daily/5day/{location_key}?apikey={ACCUWEATHER_KEY}&details=true&metric=true"
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException:
-        return None
+
+    url = f"https://dataservice.accuweather.com/forecasts/v1/daily/5day/{location_key}?apikey={ACCUWEATHER_KEY}&details=true&metric=true"
+    return await _fetch_json(session, ("accuweather", location_key), url, ACCUWEATHER_CACHE_TTL)
+
+
+def _most_common(values):
+    """Most frequent item (ties go to the earliest seen, like Counter).
+
+    Counter(...).most_common(1) builds a whole Counter and then runs a
+    selection pass; these call sites only ever need the single argmax.
+    max over the insertion-ordered dict keeps Counter's tie-break.
+    """
+    counts = {}
+    for v in values:
+        counts[v] = counts.get(v, 0) + 1
+    return max(counts, key=counts.get) if counts else None
 
 
 def get_daily_summary_and_slabs(hourly_data_list):
@@ -288,59 +402,48 @@ def get_daily_summary_and_slabs(hourly_data_list):
     all_weather_descs = []
     all_hourly_pops = []
     
-    SLAB_DEFINITIONS = [
-        (0, 2, "12:30 AM to 02:30 AM"), (2, 4, "02:30 AM to 04:30 AM"),
-        (4, 6, "04:30 AM to 06:30 AM"), (6, 8, "06:30 AM to 08:30 AM"),
-        (8, 10, "08:30 AM to 10:30 AM"), (10, 12, "10:30 AM to 12:30 PM"),
-        (12, 14, "12:30 PM to 02:30 PM"), (14, 16, "02:30 PM to 04:30 PM"),
-        (16, 18, "04:30 PM to 06:30 PM"), (18, 20, "06:30 PM to 08:30 PM"),
-        (20, 22, "08:30 PM to 10:30 PM"), (22, 2, "10:30 PM to 12:30 AM (Next Day)"),
-    ]
-    
-    slabs_data_raw = collections.defaultdict(lambda: {
-        "rain_mm": 0, "pop": [], "wind_speed": [], "visibility_km": [], 
-        "lightning": [], "descs": [], "hours_covered": 0
-    })
-    
+    # Cheap day-level pass first: totals, extremes and descriptions.
     for dt_ist, data in hourly_data_list:
         max_temp = max(max_temp, data['temp'])
         min_temp = min(min_temp, data['temp'])
         total_rain_overall += data['rain_mm']
         all_weather_descs.append(data['description'])
         all_hourly_pops.append(data['pop'])
-        
-        hour_in_day = dt_ist.hour
-        slab_key = None
-        
-        for start_h, end_h, display_name in SLAB_DEFINITIONS:
-            if start_h == 22 and end_h == 2:
-                if hour_in_day == 22 or hour_in_day == 23:
-                    slab_key = (start_h, end_h, display_name)
-                    break
-            elif start_h < end_h:
-                if hour_in_day >= start_h and hour_in_day < end_h:
-                    slab_key = (start_h, end_h, display_name)
-                    break
-        
-        if slab_key:
-            slabs_data_raw[slab_key]["rain_mm"] += data['rain_mm']
-            slabs_data_raw[slab_key]["pop"].append(data['pop'])
-            slabs_data_raw[slab_key]["wind_speed"].append(data['wind_speed'])
-            slabs_data_raw[slab_key]["visibility_km"].append(data.get('visibility_km', 10))
-            slabs_data_raw[slab_key]["descs"].append(data['description'])
-            slabs_data_raw[slab_key]["lightning"].append(data['lightning'])
-            slabs_data_raw[slab_key]["hours_covered"] += 1
-    
+
     candidate_slabs = []
-    for slab_key, slab_data in slabs_data_raw.items():
-        if slab_data["hours_covered"] > 0:
-            avg_pop = sum(slab_data["pop"]) / len(slab_data["pop"]) if slab_data["pop"] else 0
-            avg_wind = sum(slab_data["wind_speed"]) / len(slab_data["wind_speed"]) if slab_data["wind_speed"] else 0
-            avg_vis = sum(slab_data["visibility_km"]) / len(slab_data["visibility_km"]) if slab_data["visibility_km"] else 10.0
-            main_desc = collections.Counter(slab_data["descs"]).most_common(1)[0][0] if slab_data["descs"] else get_rain_type(slab_data["rain_mm"], is_2hr_slab=True)
-            explicit_lightning_in_desc = any("thunder" in d.lower() or "lightning" in d.lower() for d in slab_data["descs"])
-            
-            if slab_data["rain_mm"] >= MIN_RAINFALL_FOR_SLAB_DISPLAY_MM:
+    # No single slab can clear the display threshold unless the whole day
+    # does, so dry days skip the bucket aggregation entirely.
+    if total_rain_overall >= MIN_RAINFALL_FOR_SLAB_DISPLAY_MM:
+        # Running sums/flags only — no per-slab lists to rebuild into Counters
+        # later. Pre-seed every slab up front (finalization skips
+        # hours_covered == 0), so the hot loop does plain dict indexing with
+        # no factory call on miss.
+        slabs_data_raw = {
+            key: {**_EMPTY_SLAB_BUCKET, "desc_counts": {}}
+            for key in SLAB_DEFINITIONS
+        }
+
+        for dt_ist, data in hourly_data_list:
+            slab = slabs_data_raw[_hour_to_slab(dt_ist.hour)]
+            slab["rain_mm"] += data['rain_mm']
+            slab["pop_sum"] += data['pop']
+            slab["wind_sum"] += data['wind_speed']
+            slab["vis_sum"] += data.get('visibility_km', 10)
+            counts = slab["desc_counts"]
+            counts[data['description']] = counts.get(data['description'], 0) + 1
+            slab["has_lightning"] |= bool(data['lightning'])
+            desc_lower = data['description'].lower()
+            slab["has_thunder_desc"] |= ("thunder" in desc_lower or "lightning" in desc_lower)
+            slab["hours_covered"] += 1
+
+        for slab_key, slab_data in slabs_data_raw.items():
+            hours = slab_data["hours_covered"]
+            if hours > 0 and slab_data["rain_mm"] >= MIN_RAINFALL_FOR_SLAB_DISPLAY_MM:
+                avg_pop = slab_data["pop_sum"] / hours
+                avg_wind = slab_data["wind_sum"] / hours
+                avg_vis = slab_data["vis_sum"] / hours
+                counts = slab_data["desc_counts"]
+                main_desc = max(counts, key=counts.get) if counts else get_rain_type(slab_data["rain_mm"], is_2hr_slab=True)
                 candidate_slabs.append({
                     "time_range": slab_key[2],
                     "sort_key": slab_data["rain_mm"] + (avg_pop / 100),
@@ -349,25 +452,19 @@ def get_daily_summary_and_slabs(hourly_data_list):
                     "type": get_rain_type(slab_data["rain_mm"], is_2hr_slab=True),
                     "wind_speed": round(avg_wind, 1),
                     "visibility_km": round(avg_vis, 1),
-                    "lightning": any(slab_data["lightning"]) or explicit_lightning_in_desc,
+                    "lightning": slab_data["has_lightning"] or slab_data["has_thunder_desc"],
                     "description": main_desc
                 })
     
-    candidate_slabs.sort(key=lambda x: (-x["sort_key"], x["time_range"]))
+    # Each slab_key is unique, so a partial top-K selection replaces the
+    # full sort + dedup pass.
+    final_slabs = heapq.nsmallest(
+        MAX_SLABS_TO_SHOW, candidate_slabs,
+        key=lambda x: (-x["sort_key"], x["time_range"])
+    )
+    final_slabs.sort(key=lambda x: SLAB_ORDER_MAP.get(x["time_range"], float('inf')))
     
-    final_slabs = []
-    seen_time_ranges = set()
-    for slab in candidate_slabs:
-        if slab["time_range"] not in seen_time_ranges:
-            final_slabs.append(slab)
-            seen_time_ranges.add(slab["time_range"])
-            if len(final_slabs) >= MAX_SLABS_TO_SHOW:
-                break
-    
-    slab_order_map = {s[2]: idx for idx, s in enumerate(SLAB_DEFINITIONS)}
-    final_slabs.sort(key=lambda x: slab_order_map.get(x["time_range"], float('inf')))
-    
-    overall_raw_desc = collections.Counter(all_weather_descs).most_common(1)[0][0] if all_weather_descs else "N/A"
+    overall_raw_desc = _most_common(all_weather_descs) or "N/A"
     overall_weather_desc_with_icon = get_rain_type(total_rain_overall, is_2hr_slab=False, overall_description=overall_raw_desc)
     max_hourly_pop = max(all_hourly_pops) if all_hourly_pops else 0
     
@@ -381,171 +478,180 @@ def get_daily_summary_and_slabs(hourly_data_list):
     }
 
 
-def fetch_consolidated_forecast(lat, lon, mine_name, accuweather_location_key):
+async def fetch_consolidated_forecast(session, lat, lon, mine_name, accuweather_location_key):
     """Fetch and consolidate weather data from multiple APIs"""
-    ow_data = fetch_openweather_forecast(lat, lon)
-    om_data = fetch_open_meteo_forecast(lat, lon)
-    tm_data = fetch_tomorrow_io_forecast(lat, lon)
-    
+    # Memoize the whole consolidation, not just the raw payloads, so Streamlit
+    # reruns skip the aggregation too. mine_name stays out of the key so sites
+    # sharing coordinates hit the same entry.
+    cached = _cache_get(("consolidated", lat, lon))
+    if cached is not None:
+        return cached
+
+    # All configured providers are hit concurrently — per-mine latency is
+    # max(RTT), not sum(RTT). Providers whose API key is unset are not
+    # dispatched at all instead of paying a no-op coroutine per refresh.
+    pending = {}
+    if OPENWEATHER_KEY:
+        pending["ow"] = fetch_openweather_forecast(session, lat, lon)
+    pending["om"] = fetch_open_meteo_forecast(session, lat, lon)
+    if TOMORROWIO_KEY:
+        pending["tm"] = fetch_tomorrow_io_forecast(session, lat, lon)
+    results = dict(zip(pending, await asyncio.gather(*pending.values(), return_exceptions=True)))
+
+    def _result(key):
+        value = results.get(key)
+        return None if isinstance(value, BaseException) else value
+
+    ow_data = _result("ow")
+    om_data = _result("om")
+    tm_data = _result("tm")
+
     if not any([ow_data, om_data, tm_data]):
         return None
     
-    hourly_consolidated = {}
-    
-    # Process OpenWeatherMap hourly data
+    provider_frames = []
+
+    # One shared forecast window for all providers (also keeps them from
+    # disagreeing when now() straddles an hour boundary)
+    now_floor = pd.Timestamp.now(IST).floor("h")
+    window_lo = now_floor - pd.Timedelta(hours=1)
+    window_hi = now_floor + pd.Timedelta(hours=48)
+
+    # Process OpenWeatherMap hourly data (vectorized into a uniform DataFrame)
     if ow_data and "hourly" in ow_data:
-        for entry in ow_data["hourly"]:
-            dt_utc = datetime.fromtimestamp(entry["dt"], tz=UTC)
-            dt_ist = utc_to_ist(dt_utc)
-            hour_key = dt_ist.replace(minute=0, second=0, microsecond=0)
-            
-            if hour_key < datetime.now(IST).replace(minute=0, second=0, microsecond=0) - timedelta(hours=1) or \
-               hour_key > datetime.now(IST).replace(minute=0, second=0, microsecond=0) + timedelta(hours=48):
-                continue
-            
-            hourly_consolidated.setdefault(hour_key, {
-                'temp': [], 'rain_mm': [], 'pop': [], 'wind_speed': [],
-                'visibility_km': [], 'description': [], 'lightning': []
-            })
-            
-            hourly_consolidated[hour_key]['temp'].append(entry["temp"])
-            rain_mm = entry.get("rain", {}).get("1h", 0)
-            snow_mm = entry.get("snow", {}).get("1h", 0)
-            hourly_consolidated[hour_key]['rain_mm'].append(rain_mm + snow_mm)
-            hourly_consolidated[hour_key]['pop'].append(entry.get("pop", 0) * 100)
-            hourly_consolidated[hour_key]['wind_speed'].append(entry["wind_speed"] * 3.6)
-            hourly_consolidated[hour_key]['visibility_km'].append(entry.get("visibility", 10000) / 1000)
-            
-            if entry.get("weather"):
-                hourly_consolidated[hour_key]['description'].append(entry["weather"][0]["description"])
-                if 200 <= entry["weather"][0]["id"] < 300:
-                    hourly_consolidated[hour_key]['lightning'].append(True)
-                else:
-                    hourly_consolidated[hour_key]['lightning'].append(False)
-            else:
-                hourly_consolidated[hour_key]['description'].append("N/A")
-                hourly_consolidated[hour_key]['lightning'].append(False)
-    
-    # Process Open-Meteo hourly data
+        entries = ow_data["hourly"]
+        weather = [e["weather"][0] if e.get("weather") else None for e in entries]
+        ow_df = pd.DataFrame({
+            'hour_key': pd.to_datetime([e["dt"] for e in entries], unit="s", utc=True).tz_convert(IST).floor("h"),
+            'temp': [e["temp"] for e in entries],
+            'rain_mm': [e.get("rain", {}).get("1h", 0) + e.get("snow", {}).get("1h", 0) for e in entries],
+            'pop': [e.get("pop", 0) * 100 for e in entries],
+            'wind_speed': [e["wind_speed"] * 3.6 for e in entries],
+            'visibility_km': [e.get("visibility", 10000) / 1000 for e in entries],
+            'description': [w["description"] if w else "N/A" for w in weather],
+            'lightning': [bool(w and 200 <= w["id"] < 300) for w in weather],
+        })
+        ow_df = ow_df[(ow_df['hour_key'] >= window_lo) & (ow_df['hour_key'] <= window_hi)]
+        provider_frames.append(ow_df)
+
+    # Process Open-Meteo hourly data (arrays go straight into columns; one
+    # vectorized time parse replaces per-entry fromisoformat calls)
     if om_data and "hourly" in om_data:
-        times = om_data["hourly"]["time"]
-        temps = om_data["hourly"]["temperature_2m"]
-        precipitations = om_data["hourly"]["precipitation"]
-        weather_codes = om_data["hourly"]["weather_code"]
-        wind_speeds = om_data["hourly"]["wind_speed_10m"]
-        pops = om_data["hourly"]["precipitation_probability"]
-        visibilities = om_data["hourly"].get("visibility", [])
-        
-        for i, time_str in enumerate(times):
-            dt_ist = datetime.fromisoformat(time_str).replace(tzinfo=IST)
-            hour_key = dt_ist.replace(minute=0, second=0, microsecond=0)
-            
-            if hour_key < datetime.now(IST).replace(minute=0, second=0, microsecond=0) - timedelta(hours=1) or \
-               hour_key > datetime.now(IST).replace(minute=0, second=0, microsecond=0) + timedelta(hours=48):
-                continue
-            
-            hourly_consolidated.setdefault(hour_key, {
-                'temp': [], 'rain_mm': [], 'pop': [], 'wind_speed': [],
-                'visibility_km': [], 'description': [], 'lightning': []
-            })
-            
-            hourly_consolidated[hour_key]['temp'].append(temps[i])
-            hourly_consolidated[hour_key]['rain_mm'].append(precipitations[i])
-            hourly_consolidated[hour_key]['pop'].append(pops[i])
-            hourly_consolidated[hour_key]['wind_speed'].append(wind_speeds[i])
-            hourly_consolidated[hour_key]['visibility_km'].append(visibilities[i]/1000 if visibilities else 10)
-            hourly_consolidated[hour_key]['description'].append(get_weather_description_from_wmo_open_meteo(weather_codes[i]))
-            
-            if weather_codes[i] in [95, 96, 99]:
-                hourly_consolidated[hour_key]['lightning'].append(True)
-            else:
-                hourly_consolidated[hour_key]['lightning'].append(False)
-    
+        hourly = om_data["hourly"]
+        visibilities = hourly.get("visibility", [])
+        om_df = pd.DataFrame({
+            'hour_key': pd.to_datetime(hourly["time"]).tz_localize(IST),
+            'temp': hourly["temperature_2m"],
+            'rain_mm': hourly["precipitation"],
+            'pop': hourly["precipitation_probability"],
+            'wind_speed': hourly["wind_speed_10m"],
+            'code': hourly["weather_code"],
+        })
+        om_df['visibility_km'] = pd.Series(visibilities, dtype=float) / 1000 if visibilities else 10.0
+        om_df['description'] = om_df['code'].map(OPEN_METEO_WMO_CODES).fillna("Unknown")
+        om_df['lightning'] = om_df['code'].isin(OPEN_METEO_LIGHTNING_CODES)
+        om_df = om_df[(om_df['hour_key'] >= window_lo) & (om_df['hour_key'] <= window_hi)]
+        provider_frames.append(om_df.drop(columns=['code']))
+
     # Process Tomorrow.io hourly data
     if tm_data and "timelines" in tm_data and "hourly" in tm_data["timelines"]:
-        for interval in tm_data["timelines"]["hourly"]:
-            dt_iso_str = interval["time"]
-            dt_utc_naive = datetime.strptime(dt_iso_str, '%Y-%m-%dT%H:%M:%SZ')
-            dt_utc_aware = UTC.localize(dt_utc_naive)
-            dt_ist = dt_utc_aware.astimezone(IST)
-            hour_key = dt_ist.replace(minute=0, second=0, microsecond=0)
-            
-            if hour_key < datetime.now(IST).replace(minute=0, second=0, microsecond=0) - timedelta(hours=1) or \
-               hour_key > datetime.now(IST).replace(minute=0, second=0, microsecond=0) + timedelta(hours=48):
-                continue
-            
-            values = interval["values"]
-            
-            hourly_consolidated.setdefault(hour_key, {
-                'temp': [], 'rain_mm': [], 'pop': [], 'wind_speed': [],
-                'visibility_km': [], 'description': [], 'lightning': []
-            })
-            
-            hourly_consolidated[hour_key]['temp'].append(values.get("temperature", 0))
-            hourly_consolidated[hour_key]['rain_mm'].append(values.get("precipitationIntensity", 0))
-            hourly_consolidated[hour_key]['pop'].append(values.get("precipitationProbability", 0))
-            hourly_consolidated[hour_key]['wind_speed'].append(values.get("windSpeed", 0) * 3.6)
-            hourly_consolidated[hour_key]['visibility_km'].append(values.get("visibility", 10000) / 1000)
-            
-            tm_weather_code = values.get("weatherCode")
-            if tm_weather_code is not None:
-                hourly_consolidated[hour_key]['description'].append(get_weather_description_from_wmo_tomorrow_io(tm_weather_code))
-            else:
-                hourly_consolidated[hour_key]['description'].append("N/A")
-            
-            if values.get("lightningStrikeCount", 0) > 0 or tm_weather_code == 8000:
-                hourly_consolidated[hour_key]['lightning'].append(True)
-            else:
-                hourly_consolidated[hour_key]['lightning'].append(False)
-    
-    # Aggregate consolidated hourly data
-    final_hourly_data = []
-    sorted_hour_keys = sorted(hourly_consolidated.keys())
-    
-    for hour_key in sorted_hour_keys:
-        aggregated_data = hourly_consolidated[hour_key]
-        
-        avg_temp = sum(aggregated_data['temp']) / len(aggregated_data['temp']) if aggregated_data['temp'] else 0
-        avg_rain = sum(aggregated_data['rain_mm']) / len(aggregated_data['rain_mm']) if aggregated_data['rain_mm'] else 0
-        avg_pop = sum(aggregated_data['pop']) / len(aggregated_data['pop']) if aggregated_data['pop'] else 0
-        avg_wind_speed = sum(aggregated_data['wind_speed']) / len(aggregated_data['wind_speed']) if aggregated_data['wind_speed'] else 0
-        avg_visibility_km = sum(aggregated_data['visibility_km']) / len(aggregated_data['visibility_km']) if aggregated_data['visibility_km'] else 10.0
-        
-        most_common_desc = collections.Counter(aggregated_data['description']).most_common(1)
-        hourly_description = most_common_desc[0][0] if most_common_desc else "N/A"
-        has_lightning = any(aggregated_data['lightning'])
-        
-        final_hourly_data.append((
-            hour_key,
+        intervals = tm_data["timelines"]["hourly"]
+        values_list = [iv["values"] for iv in intervals]
+        codes = pd.Series([v.get("weatherCode") for v in values_list])
+        tm_df = pd.DataFrame({
+            'hour_key': pd.to_datetime([iv["time"] for iv in intervals], utc=True).tz_convert(IST).floor("h"),
+            'temp': [v.get("temperature", 0) for v in values_list],
+            'rain_mm': [v.get("precipitationIntensity", 0) for v in values_list],
+            'pop': [v.get("precipitationProbability", 0) for v in values_list],
+            'wind_speed': [v.get("windSpeed", 0) * 3.6 for v in values_list],
+            'visibility_km': [v.get("visibility", 10000) / 1000 for v in values_list],
+            'description': codes.map(TOMORROW_IO_WEATHER_CODES).fillna("N/A"),
+            'lightning': [v.get("lightningStrikeCount", 0) > 0 or v.get("weatherCode") == 8000 for v in values_list],
+        })
+        tm_df = tm_df[(tm_df['hour_key'] >= window_lo) & (tm_df['hour_key'] <= window_hi)]
+        provider_frames.append(tm_df)
+
+    if not provider_frames:
+        return None
+
+    # Stack all providers into one long frame and reduce each hour bucket with
+    # vectorized groupby aggregations instead of Python-level sum/len loops
+    all_df = pd.concat(provider_frames, ignore_index=True)
+    if all_df.empty:
+        return None
+
+    aggregated = all_df.groupby('hour_key', sort=True).agg(
+        temp=('temp', 'mean'),
+        rain_mm=('rain_mm', 'mean'),
+        pop=('pop', 'mean'),
+        wind_speed=('wind_speed', 'mean'),
+        visibility_km=('visibility_km', 'mean'),
+        description=('description', _most_common),
+        lightning=('lightning', 'any'),
+    )
+
+    # Group hourly data by day. The aggregated frame already stores each
+    # field as a contiguous column array, so pull the columns out once and
+    # zip them instead of paying itertuples' per-row namedtuple boxing.
+    hour_keys = aggregated.index.to_pydatetime()
+    columns = (aggregated[col].to_numpy() for col in
+               ('temp', 'rain_mm', 'pop', 'wind_speed', 'visibility_km',
+                'description', 'lightning'))
+    forecast_by_day = collections.defaultdict(list)
+    for dt_ist, temp, rain_mm, pop, wind, vis, desc, lightning in zip(hour_keys, *columns):
+        forecast_by_day[dt_ist.date()].append((
+            dt_ist,
             {
-                'temp': avg_temp,
-                'rain_mm': avg_rain,
-                'pop': avg_pop,
-                'wind_speed': avg_wind_speed,
-                'visibility_km': avg_visibility_km,
-                'description': hourly_description,
-                'lightning': has_lightning
+                'temp': temp,
+                'rain_mm': rain_mm,
+                'pop': pop,
+                'wind_speed': wind,
+                'visibility_km': vis,
+                'description': desc,
+                'lightning': bool(lightning)
             }
         ))
-    
-    # Group hourly data by day
-    forecast_by_day = collections.defaultdict(list)
-    for dt_ist, data in final_hourly_data:
-        day_key = dt_ist.date()
-        forecast_by_day[day_key].append((dt_ist, data))
-    
+
+    forecast_by_day = dict(forecast_by_day)
+    _cache_put(("consolidated", lat, lon), forecast_by_day)
     return forecast_by_day
 
 
+async def fetch_all_forecasts(mines):
+    """Fetch consolidated forecasts for all selected mines concurrently"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def bounded_fetch(session, mine):
+        async with semaphore:
+            return await fetch_consolidated_forecast(
+                session, mine["lat"], mine["lon"], mine["name"], mine["accuweather_location_key"]
+            )
+
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with asyncio.timeout(BULK_FETCH_TIMEOUT):
+            results = await asyncio.gather(
+                *(bounded_fetch(session, mine) for mine in mines),
+                return_exceptions=True,
+            )
+
+    return {
+        mine["name"]: (None if isinstance(result, BaseException) else result)
+        for mine, result in zip(mines, results)
+    }
+
+
 def main():
     """Main Streamlit application"""
     st.markdown('<div class="main-header">⛏️ Mining Weather Forecast Dashboard</div>', unsafe_allow_html=True)
     
     # Sidebar
+    mine_locations = get_mine_locations()
+
     with st.sidebar:
         st.header("⚙️ Settings")
         
-        mine_names = [mine["name"] for mine in MINE_LOCATIONS if mine["name"]]
+        mine_names = [mine["name"] for mine in mine_locations]
         selected_mines = st.multiselect(
             "Select Mine Locations",
             mine_names,
@@ -558,26 +664,36 @@ def main():
         
         if st.button("🔄 Refresh Data"):
             st.cache_data.clear()
+            _api_cache.clear()
+            if _DISK_CACHE is not None:
+                _DISK_CACHE.clear()
+            for key in [k for k in st.session_state if k.startswith("summary_")]:
+                del st.session_state[key]
             st.rerun()
     
     if not selected_mines:
         st.warning("⚠️ Please select at least one mine location from the sidebar.")
         return
-    
+
+    # Fetch all selected mines in one concurrent batch
+    mines_to_fetch = [m for m in mine_locations if m["name"] in selected_mines]
+    with st.spinner(f"Fetching forecasts for {len(mines_to_fetch)} mine(s)..."):
+        try:
+            forecasts = asyncio.run(fetch_all_forecasts(mines_to_fetch))
+        except TimeoutError:
+            forecasts = {}
+
     # Display forecast for each selected mine
     for mine_name in selected_mines:
-        mine = next((m for m in MINE_LOCATIONS if m["name"] == mine_name), None)
+        mine = next((m for m in mine_locations if m["name"] == mine_name), None)
         if not mine:
             continue
-        
+
         st.markdown(f'<div class="mine-name">📍 {mine_name}</div>', unsafe_allow_html=True)
         st.markdown(f"**Coordinates:** Lat {mine['lat']}, Lon {mine['lon']}")
-        
-        with st.spinner(f"Fetching forecast for {mine_name}..."):
-            forecast_by_day = fetch_consolidated_forecast(
-                mine["lat"], mine["lon"], mine["name"], mine["accuweather_location_key"]
-            )
-        
+
+        forecast_by_day = forecasts.get(mine_name)
+
         if not forecast_by_day:
             st.error("❌ Unable to fetch forecast data. Please check API keys and network connectivity.")
             continue
@@ -596,7 +712,12 @@ def main():
                     continue
                 
                 day_hourly_data = forecast_by_day[target_day]
-                day_summary = get_daily_summary_and_slabs(day_hourly_data)
+                # Memoize the slab scan per mine/day so flipping tabs on a
+                # rerun does not repeat the full aggregation + sort.
+                summary_key = f"summary_{mine_name}_{target_day.isoformat()}"
+                if summary_key not in st.session_state:
+                    st.session_state[summary_key] = get_daily_summary_and_slabs(day_hourly_data)
+                day_summary = st.session_state[summary_key]
                 
                 st.markdown(f"### {target_day.strftime('%d %B, %Y')}")
                 
@@ -632,6 +753,9 @@ def main():
                 if day_summary['slabs']:
                     st.markdown("### 🌧️ Precipitation Windows")
                     
+                    # Emit all cards in one st.markdown call so Streamlit
+                    # ships a single element to the browser per tab.
+                    card_parts = []
                     for slab in day_summary['slabs']:
                         alerts = []
                         if slab['lightning']:
@@ -640,27 +764,29 @@ def main():
                             alerts.append(f"💨 High Wind ({slab['wind_speed']} km/h)")
                         if slab['visibility_km'] <= VISIBILITY_ALERT_THRESHOLD_KM:
                             alerts.append(f"👁️ Low Visibility ({slab['visibility_km']} km)")
-                        
+
                         alert_str = " | ".join(alerts) if alerts else "No alerts"
-                        
-                        st.markdown(f"""
+
+                        card_parts.append(f"""
                         <div class="slab-card">
                             <strong>{slab['time_range']}</strong><br>
                             🌧️ {slab['mm']} mm ({slab['type']}) - {slab['prob']}% probability<br>
                             <span style="color: {'#f44336' if alerts else '#4caf50'};">{alert_str}</span>
                         </div>
-                        """, unsafe_allow_html=True)
+                        """)
+                    st.markdown("\n".join(card_parts), unsafe_allow_html=True)
                 else:
                     st.info("No significant precipitation expected.")
                 
                 # Temperature Chart
                 if day_hourly_data:
                     st.markdown("### 🌡️ Temperature Trend")
-                    temp_data = pd.DataFrame([
-                        {"Time": dt.strftime("%H:%M"), "Temperature (°C)": data['temp']}
-                        for dt, data in day_hourly_data
-                    ])
-                    st.line_chart(temp_data.set_index("Time"))
+                    temps = np.fromiter(
+                        (data['temp'] for _, data in day_hourly_data),
+                        dtype=np.float32, count=len(day_hourly_data)
+                    )
+                    times = pd.DatetimeIndex([dt for dt, _ in day_hourly_data])
+                    st.line_chart(pd.Series(temps, index=times, name="Temperature (°C)"))
                 
                 st.markdown("---")
     
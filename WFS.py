@@ -3,10 +3,11 @@ Adani Natural Resources — WIM (Weather Intelligence Mining)
 v3.0 — Supabase DB integration, clock fix, sidebar redesign,
         hourly precipitation for all days, mining impact column
 """
-import os, json, requests, collections, base64, concurrent.futures
+import os, json, orjson, requests, bisect, collections, base64, concurrent.futures, functools, tempfile
 import streamlit.components.v1 as components
+import numpy as np
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 import streamlit as st
 
 # ── Load .env for local development ──
@@ -57,10 +58,14 @@ def _asset_path(filename):
         if os.path.exists(p): return p
     return os.path.join(_SCRIPT_DIR, filename)
 
-LOGO_PATH = _asset_path("Adani_2012_logo.png")
-FONT_PATH = _asset_path("adani-regular.ttf")
-LOGO_B64  = load_asset_b64(LOGO_PATH)
-FONT_B64  = load_asset_b64(FONT_PATH)
+# Asset reads (file open + base64 encode) are cached per process — this
+# script re-executes on every rerun and was re-reading both files each time.
+@st.cache_resource
+def _load_assets():
+    return (load_asset_b64(_asset_path("Adani_2012_logo.png")),
+            load_asset_b64(_asset_path("adani-regular.ttf")))
+
+LOGO_B64, FONT_B64 = _load_assets()
 _FONT_LOADED = bool(FONT_B64)
 _LOGO_LOADED = bool(LOGO_B64)
 
@@ -68,7 +73,12 @@ LOGO_HTML  = f'<img src="data:image/png;base64,{LOGO_B64}" style="height:44px;di
 _FONT_STACK = ("'AdaniFont', 'Helvetica Neue', Arial, sans-serif" if FONT_B64 else "'Helvetica Neue', Arial, sans-serif")
 FONT_FACE  = f"@font-face{{font-family:'AdaniFont';src:url('data:font/truetype;base64,{FONT_B64}') format('truetype');font-weight:normal;font-style:normal;}}" if FONT_B64 else ""
 
-_CSS = f"""<style>
+# The CSS blob itself is also built once per process; the st.markdown call
+# below still runs every rerun (Streamlit drops elements that are not
+# re-emitted), but the interpolation of the embedded font/logo is not repeated.
+@st.cache_resource
+def _build_css():
+    return f"""<style>
 {FONT_FACE}
 *,*::before,*::after{{box-sizing:border-box;}}
 html,body,[class*="css"],.stApp,.stApp *,[data-testid="stAppViewContainer"],[data-testid="stAppViewContainer"] *,.block-container,.block-container *{{font-family:{_FONT_STACK} !important;}}
@@ -165,6 +175,8 @@ div[data-testid="stSelectbox"] [role="option"],div[data-testid="stSelectbox"] [r
 div[data-testid="stSelectbox"] [role="option"]:hover{{background:#F3F4F6 !important;}}
 div[data-testid="stSelectbox"] [role="option"][aria-selected="true"],div[data-testid="stSelectbox"] [role="option"][aria-selected="true"] *{{background:#0B74B0 !important;color:#FFFFFF !important;font-weight:600 !important;}}
 </style>"""
+
+_CSS = _build_css()
 st.markdown(_CSS, unsafe_allow_html=True)
 
 # ══════════════════════════════════════════════════════════════
@@ -185,11 +197,28 @@ DEFAULT_SITES = [
     {"id": "builtin-kurmitra",   "name": "Kurmitra",       "lat": 21.754655, "lon": 85.161185, "builtin": True},
 ]
 
-IST       = pytz.timezone('Asia/Kolkata')
-UTC       = pytz.utc
+IST       = ZoneInfo('Asia/Kolkata')
+UTC       = ZoneInfo('UTC')
 TIMEOUT   = 20
 RETRY_MAX = 3
 
+# Shared HTTP session — keep-alive avoids a fresh DNS + TLS handshake per
+# provider call, and gzip shrinks the JSON payloads on the wire. Built behind
+# st.cache_resource so reruns of this script reuse the same pooled sockets
+# instead of instantiating a new Session each time.
+@st.cache_resource
+def get_http_session():
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=16, pool_maxsize=32,
+        max_retries=requests.adapters.Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip"})
+    return session
+
+SESSION = get_http_session()
+
 WIND_CAUTION = 30
 WIND_STOP    = 32
 VIS_CAUTION  = 1.0
@@ -199,6 +228,24 @@ RAIN_HEAVY   = 5.0
 
 API_WEIGHTS = {"accuweather": 0.35, "open_meteo": 0.30, "openweather": 0.25, "tomorrow_io": 0.10, "imd": 0.10}
 
+# Provider URL templates — only the coordinates (and Open-Meteo day count)
+# vary per call, so the key/query concatenation is done once at import.
+OPENWEATHER_URL = ("https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}"
+                   "&units=metric&exclude=minutely,daily,alerts&appid=" + OPENWEATHER_KEY)
+OPEN_METEO_URL  = ("https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}"
+                   "&hourly=temperature_2m,precipitation,weather_code,wind_speed_10m,"
+                   "precipitation_probability,visibility,relative_humidity_2m"
+                   "&forecast_days={days}&timezone=Asia%2FKolkata")
+TOMORROW_IO_URL = ("https://api.tomorrow.io/v4/weather/forecast?location={lat},{lon}"
+                   "&units=metric&apikey=" + TOMORROWIO_KEY)
+ACCUWEATHER_LOCATION_URL = ("https://dataservice.accuweather.com/locations/v1/cities/geoposition/search"
+                            "?q={lat},{lon}&apikey=" + ACCUWEATHER_KEY)
+ACCUWEATHER_HOURLY_URL   = ("https://dataservice.accuweather.com/forecasts/v1/hourly/12hour/{key}"
+                            "?apikey=" + ACCUWEATHER_KEY + "&details=true&metric=true")
+MINUTECAST_URL = ("https://dataservice.accuweather.com/forecasts/v1/minute"
+                  "?q={lat},{lon}&apikey=" + ACCUWEATHER_KEY + "&details=true")
+IMD_URL = "https://mausam.imd.gov.in/api/nowcast_district_api.php?lat={lat}&lon={lon}"
+
 # ══════════════════════════════════════════════════════════════
 # SITE MANAGEMENT — Supabase-first, JSON fallback
 # ══════════════════════════════════════════════════════════════
@@ -308,8 +355,9 @@ def set_default_site(name):
 # ══════════════════════════════════════════════════════════════
 # SESSION STATE INIT
 # ══════════════════════════════════════════════════════════════
-ALL_SITES = load_sites()
-_names    = [s["name"] for s in ALL_SITES]
+ALL_SITES    = load_sites()
+SITE_BY_NAME = {s["name"]: s for s in ALL_SITES}
+_names       = [s["name"] for s in ALL_SITES]
 
 if "active_site" not in st.session_state:
     _def = get_default_site()
@@ -320,16 +368,20 @@ if "active_site" not in st.session_state:
 # ══════════════════════════════════════════════════════════════
 def now_ist(): return datetime.now(IST)
 def utc_to_ist(dt):
-    if dt.tzinfo is None: dt = UTC.localize(dt)
+    if dt.tzinfo is None: dt = dt.replace(tzinfo=UTC)
     return dt.astimezone(IST)
 
+# Monotonic rainfall tiers resolved with one binary search per call instead
+# of walking the branch ladder; index = bisect_right(thresholds, mm).
+_RAIN_BADGE_THRESHOLDS = (0.3, 1.5, 5.0, 8.0)
+_RAIN_BADGE_TIERS = (("b-drizzle", "Drizzle"), ("b-light", "Light"),
+                     ("b-moderate", "Moderate"), ("b-heavy", "Heavy"),
+                     ("b-vheavy", "Very Heavy"))
+
 def rain_badge_html(mm):
-    if mm == 0:     return '<span class="wim-badge b-none">0 mm</span>'
-    elif mm < 0.3:  return f'<span class="wim-badge b-drizzle">{mm} mm · Drizzle</span>'
-    elif mm < 1.5:  return f'<span class="wim-badge b-light">{mm} mm · Light</span>'
-    elif mm < 5.0:  return f'<span class="wim-badge b-moderate">{mm} mm · Moderate</span>'
-    elif mm < 8.0:  return f'<span class="wim-badge b-heavy">{mm} mm · Heavy</span>'
-    else:           return f'<span class="wim-badge b-vheavy">{mm} mm · Very Heavy</span>'
+    if mm == 0: return '<span class="wim-badge b-none">0 mm</span>'
+    css, label = _RAIN_BADGE_TIERS[bisect.bisect_right(_RAIN_BADGE_THRESHOLDS, mm)]
+    return f'<span class="wim-badge {css}">{mm} mm · {label}</span>'
 
 def mining_impact_html(mm, wind, vis, lightning):
     if lightning:
@@ -358,70 +410,99 @@ def condition_str(total, descs):
 # ══════════════════════════════════════════════════════════════
 # API FETCHES
 # ══════════════════════════════════════════════════════════════
-@st.cache_data(ttl=1800)
+# Second-tier on-disk cache under st.cache_data: survives process restarts
+# and is shared across sessions/replicas. Optional, same pattern as the
+# Supabase client — silently disabled when diskcache is not installed.
+try:
+    import diskcache
+    _DISK_CACHE = diskcache.Cache(os.path.join(tempfile.gettempdir(), "wim_forecast_cache"))
+except Exception:
+    _DISK_CACHE = None
+
+def _disk_cached(provider, expire=1800):
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(lat, lon, *args):
+            if _DISK_CACHE is None:
+                return fn(lat, lon, *args)
+            # ~100 m coordinate grid + current UTC hour; nearby duplicate
+            # sites and restarted workers share one entry.
+            key = ":".join([provider, f"{lat:.3f}", f"{lon:.3f}",
+                            *map(str, args), datetime.now(UTC).strftime("%Y%m%d%H")])
+            hit = _DISK_CACHE.get(key)
+            if hit is not None:
+                return hit
+            result = fn(lat, lon, *args)
+            if result[0] is not None:
+                _DISK_CACHE.set(key, result, expire=expire)
+            return result
+        return wrapper
+    return deco
+
+@st.cache_data(ttl=600)
+@_disk_cached("openweather", expire=600)
 def fetch_openweather(lat, lon):
     if not OPENWEATHER_KEY: return None, "no key"
     try:
-        r = requests.get(
-            f"https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}"
-            f"&units=metric&exclude=minutely,daily,alerts&appid={OPENWEATHER_KEY}", timeout=TIMEOUT)
-        r.raise_for_status(); return r.json(), None
+        r = SESSION.get(OPENWEATHER_URL.format(lat=lat, lon=lon), timeout=TIMEOUT)
+        r.raise_for_status(); return orjson.loads(r.content), None
     except Exception as e: return None, str(e)
 
-@st.cache_data(ttl=1800)
+@st.cache_data(ttl=900)
+@_disk_cached("open_meteo", expire=900)
 def fetch_open_meteo(lat, lon, days=7):
-    url = (
-        f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}"
-        f"&hourly=temperature_2m,precipitation,weather_code,wind_speed_10m,"
-        f"precipitation_probability,visibility,relative_humidity_2m"
-        f"&forecast_days={days}&timezone=Asia%2FKolkata"
-    )
+    url = OPEN_METEO_URL.format(lat=lat, lon=lon, days=days)
     last_err = "unknown"
     for _ in range(RETRY_MAX):
         try:
-            r = requests.get(url, timeout=TIMEOUT)
+            r = SESSION.get(url, timeout=TIMEOUT)
             r.raise_for_status()
-            return r.json(), None
+            return orjson.loads(r.content), None
         except Exception as e:
             last_err = str(e)
     return None, f"Failed after {RETRY_MAX} attempts: {last_err}"
 
-@st.cache_data(ttl=1800)
+@st.cache_data(ttl=900)
+@_disk_cached("tomorrow_io", expire=900)
 def fetch_tomorrow_io(lat, lon):
     if not TOMORROWIO_KEY: return None, "no key"
     try:
-        r = requests.get(
-            f"https://api.tomorrow.io/v4/weather/forecast?location={lat},{lon}"
-            f"&units=metric&apikey={TOMORROWIO_KEY}", timeout=TIMEOUT)
-        r.raise_for_status(); return r.json(), None
+        r = SESSION.get(TOMORROW_IO_URL.format(lat=lat, lon=lon), timeout=TIMEOUT)
+        r.raise_for_status(); return orjson.loads(r.content), None
     except Exception as e: return None, str(e)
 
-@st.cache_data(ttl=1800)
+@st.cache_data(ttl=86400)
+def fetch_accuweather_location_key(lat, lon):
+    """Resolve the AccuWeather location key for a coordinate (keys are static,
+    so cache for a day — saves one round-trip per forecast refresh).
+    Raises on failure: st.cache_data skips calls that raise, so a transient
+    geoposition error never pins a blank key for the full 24h TTL."""
+    lr = SESSION.get(ACCUWEATHER_LOCATION_URL.format(lat=lat, lon=lon), timeout=TIMEOUT)
+    lr.raise_for_status()
+    return orjson.loads(lr.content).get("Key", "")
+
+@st.cache_data(ttl=3600)
+@_disk_cached("accuweather", expire=3600)
 def fetch_accuweather_hourly(lat, lon):
     if not ACCUWEATHER_KEY: return None, "no key"
     try:
-        lr = requests.get(
-            f"https://dataservice.accuweather.com/locations/v1/cities/geoposition/search"
-            f"?q={lat},{lon}&apikey={ACCUWEATHER_KEY}", timeout=TIMEOUT)
-        lr.raise_for_status()
-        key = lr.json().get("Key", "")
-        if not key: return None, "no location key"
-        fr = requests.get(
-            f"https://dataservice.accuweather.com/forecasts/v1/hourly/12hour/{key}"
-            f"?apikey={ACCUWEATHER_KEY}&details=true&metric=true", timeout=TIMEOUT)
-        fr.raise_for_status(); return fr.json(), None
+        key = fetch_accuweather_location_key(lat, lon)
+    except Exception as e: return None, str(e)
+    if not key: return None, "no location key"
+    try:
+        fr = SESSION.get(ACCUWEATHER_HOURLY_URL.format(key=key), timeout=TIMEOUT)
+        fr.raise_for_status(); return orjson.loads(fr.content), None
     except Exception as e: return None, str(e)
 
 @st.cache_data(ttl=900)
+@_disk_cached("minutecast", expire=900)
 def fetch_minutecast(lat, lon):
     if not ACCUWEATHER_KEY: return None, "no key"
     try:
-        r = requests.get(
-            f"https://dataservice.accuweather.com/forecasts/v1/minute"
-            f"?q={lat},{lon}&apikey={ACCUWEATHER_KEY}&details=true", timeout=TIMEOUT)
+        r = SESSION.get(MINUTECAST_URL.format(lat=lat, lon=lon), timeout=TIMEOUT)
         r.raise_for_status()
         out = []
-        for m in r.json().get("Intervals", []):
+        for m in orjson.loads(r.content).get("Intervals", []):
             dbz  = m.get("Dbz", 0)
             mmhr = ((10 ** (dbz / 10.0)) / 200.0) ** (1 / 1.6) if dbz > 0 else 0.0
             out.append({"minute": m.get("StartMinute", 0), "mm_per_min": mmhr / 60.0,
@@ -430,37 +511,45 @@ def fetch_minutecast(lat, lon):
     except Exception as e: return None, str(e)
 
 @st.cache_data(ttl=1800)
+@_disk_cached("imd", expire=1800)
 def fetch_imd(lat, lon):
     """Fetch nowcast from India Meteorological Department."""
     try:
-        r = requests.get(
-            f"https://mausam.imd.gov.in/api/nowcast_district_api.php"
-            f"?lat={lat}&lon={lon}",
-            timeout=TIMEOUT)
+        r = SESSION.get(IMD_URL.format(lat=lat, lon=lon), timeout=TIMEOUT)
         r.raise_for_status()
-        return r.json(), None
+        return orjson.loads(r.content), None
     except Exception as e: return None, str(e)
 
 # ══════════════════════════════════════════════════════════════
 # ENSEMBLE
 # ══════════════════════════════════════════════════════════════
+@st.cache_resource
+def _get_fetch_executor():
+    """One long-lived worker pool per process; spawning six threads on every
+    refresh was pure overhead."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=6)
+
 def build_forecast(lat, lon, days=7):
+    # Quantize to a ~100 m grid so sites with identical (or near-identical)
+    # coordinates share fetcher cache entries instead of issuing duplicate
+    # provider calls; the forecasts are indistinguishable at that distance.
+    lat, lon = round(lat, 3), round(lon, 3)
     # Fetch all providers concurrently to reduce overall load time.
-    with concurrent.futures.ThreadPoolExecutor(max_workers=6) as ex:
-        futs = {
-            "ow": ex.submit(fetch_openweather, lat, lon),
-            "om": ex.submit(fetch_open_meteo, lat, lon, days),
-            "tm": ex.submit(fetch_tomorrow_io, lat, lon),
-            "aw": ex.submit(fetch_accuweather_hourly, lat, lon),
-            "mc": ex.submit(fetch_minutecast, lat, lon),
-            "imd": ex.submit(fetch_imd, lat, lon),
-        }
-        ow, ow_err   = futs["ow"].result()
-        om, om_err   = futs["om"].result()
-        tm, tm_err   = futs["tm"].result()
-        aw, aw_err   = futs["aw"].result()
-        mc, mc_err   = futs["mc"].result()
-        imd, imd_err = futs["imd"].result()
+    ex = _get_fetch_executor()
+    futs = {
+        "ow": ex.submit(fetch_openweather, lat, lon),
+        "om": ex.submit(fetch_open_meteo, lat, lon, days),
+        "tm": ex.submit(fetch_tomorrow_io, lat, lon),
+        "aw": ex.submit(fetch_accuweather_hourly, lat, lon),
+        "mc": ex.submit(fetch_minutecast, lat, lon),
+        "imd": ex.submit(fetch_imd, lat, lon),
+    }
+    ow, ow_err   = futs["ow"].result()
+    om, om_err   = futs["om"].result()
+    tm, tm_err   = futs["tm"].result()
+    aw, aw_err   = futs["aw"].result()
+    mc, mc_err   = futs["mc"].result()
+    imd, imd_err = futs["imd"].result()
 
     src_status = {
         "Open-Meteo":  "ok" if om else str(om_err),
@@ -517,7 +606,7 @@ def build_forecast(lat, lon, days=7):
         vis = h.get("visibility", [])
         hum = h.get("relative_humidity_2m", [])
         for i, ts in enumerate(h["time"]):
-            hk = datetime.fromisoformat(ts).replace(tzinfo=IST).replace(minute=0, second=0, microsecond=0)
+            hk = datetime.fromisoformat(ts).replace(minute=0, second=0, microsecond=0, tzinfo=IST)
             vis_km = max(1.0, vis[i]/1000) if vis and i < len(vis) and vis[i] > 100 else 10.0
             add(hk, "open_meteo",
                 h["temperature_2m"][i], h["precipitation"][i],
@@ -528,7 +617,7 @@ def build_forecast(lat, lon, days=7):
 
     if tm and "timelines" in tm and "hourly" in tm["timelines"]:
         for iv in tm["timelines"]["hourly"]:
-            try: dt_utc = UTC.localize(datetime.strptime(iv["time"], '%Y-%m-%dT%H:%M:%SZ'))
+            try: dt_utc = datetime.strptime(iv["time"], '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=UTC)
             except: continue
             hk = utc_to_ist(dt_utc).replace(minute=0, second=0, microsecond=0)
             v  = iv["values"]
@@ -542,7 +631,7 @@ def build_forecast(lat, lon, days=7):
         for e in aw:
             try:
                 dt = datetime.fromisoformat(e.get("DateTime", ""))
-                if dt.tzinfo is None: dt = UTC.localize(dt)
+                if dt.tzinfo is None: dt = dt.replace(tzinfo=UTC)
                 hk = dt.astimezone(IST).replace(minute=0, second=0, microsecond=0)
             except: continue
             add(hk, "accuweather",
@@ -568,27 +657,35 @@ def build_forecast(lat, lon, days=7):
     final = []
     for hk in sorted(raw.keys()):
         srcs = raw[hk]
-        def wavg(field):
-            pairs = [(d[field], API_WEIGHTS.get(src, 0.1)) for src, d in srcs.items()]
-            tw    = sum(w for _, w in pairs)
-            return sum(v * w for v, w in pairs) / tw if tw else 0.0
-        def wavg_vis():
-            """Weighted average for visibility, filtering out anomalously low values."""
-            pairs = [(d["vis"], API_WEIGHTS.get(src, 0.1)) for src, d in srcs.items() if d["vis"] >= 0.5]
-            tw = sum(w for _, w in pairs)
-            result = sum(v * w for v, w in pairs) / tw if tw else 10.0
-            return max(0.5, result)
-        rain_vals = [d["rain"] for d in srcs.values() if d["rain"] > 0.2]
-        rain_out  = wavg("rain") if len(rain_vals) >= 2 else (rain_vals[0] * 0.5 if len(rain_vals) == 1 else 0.0)
-        pop_raw   = wavg("pop")
+        # One pass over the sources accumulating weighted sums per field,
+        # instead of re-scanning the source dict through a fresh wavg()
+        # closure for each of the six fields.
+        t_sum = r_sum = p_sum = w_sum = h_sum = tw = 0.0
+        v_sum = v_tw = 0.0          # visibility filters out anomalously low values
+        rain_vals, descs = [], []
+        lightning = False
+        for src, d in srcs.items():
+            w = API_WEIGHTS.get(src, 0.1)
+            tw    += w
+            t_sum += d["temp"] * w; r_sum += d["rain"] * w
+            p_sum += d["pop"]  * w; w_sum += d["wind"] * w
+            h_sum += d["hum"]  * w
+            if d["vis"] >= 0.5:
+                v_sum += d["vis"] * w; v_tw += w
+            if d["rain"] > 0.2: rain_vals.append(d["rain"])
+            if d["desc"]:       descs.append(d["desc"])
+            lightning = lightning or d["lightning"]
+        inv       = 1.0 / tw if tw else 0.0
+        vis_out   = max(0.5, v_sum / v_tw) if v_tw else 10.0
+        rain_out  = (r_sum * inv) if len(rain_vals) >= 2 else (rain_vals[0] * 0.5 if len(rain_vals) == 1 else 0.0)
+        pop_raw   = p_sum * inv
         pop_out   = pop_raw if rain_out > 0 or pop_raw >= 40 else pop_raw * 0.5
-        descs     = [d["desc"] for d in srcs.values() if d["desc"]]
         best      = collections.Counter(descs).most_common(1)[0][0] if descs else ""
         final.append((hk, {
-            "temp": round(wavg("temp"), 1), "rain_mm": round(rain_out, 2),
-            "pop": round(pop_out, 1), "wind_kmh": round(wavg("wind"), 1),
-            "vis_km": round(wavg_vis(), 1), "humidity": round(wavg("hum"), 1),
-            "lightning": any(d["lightning"] for d in srcs.values()),
+            "temp": round(t_sum * inv, 1), "rain_mm": round(rain_out, 2),
+            "pop": round(pop_out, 1), "wind_kmh": round(w_sum * inv, 1),
+            "vis_km": round(vis_out, 1), "humidity": round(h_sum * inv, 1),
+            "lightning": lightning,
             "desc": best, "n_sources": len(srcs)}))
 
     by_day = collections.defaultdict(list)
@@ -624,22 +721,29 @@ def hour_to_slab(h):
     return None
 
 def build_slabs(hourly):
-    raw = collections.defaultdict(lambda: dict(rain=0, pop=[], wind=[], vis=[], lightning=[], hum=[], count=0))
+    # Running sums per slab; at <=48 samples a day the interpreted loop is
+    # the right tool — no per-field lists to rebuild and average afterwards.
+    raw = {}
     for hk, d in hourly:
         sk = hour_to_slab(hk.hour)
         if not sk: continue
-        r = raw[sk]
-        r["rain"] += d["rain_mm"]; r["pop"].append(d["pop"])
-        r["wind"].append(d["wind_kmh"]); r["vis"].append(d["vis_km"])
-        r["lightning"].append(d["lightning"]); r["hum"].append(d["humidity"]); r["count"] += 1
+        r = raw.get(sk)
+        if r is None:
+            r = raw[sk] = dict(rain=0.0, pop=0.0, wind=0.0, vis=0.0, hum=0.0,
+                               lightning=False, count=0)
+        r["rain"] += d["rain_mm"]; r["pop"] += d["pop"]
+        r["wind"] += d["wind_kmh"]; r["vis"] += d["vis_km"]
+        r["hum"] += d["humidity"]
+        r["lightning"] = r["lightning"] or d["lightning"]
+        r["count"] += 1
     slabs = []
     for sk, r in raw.items():
-        if not r["count"]: continue
-        avg = lambda lst: sum(lst) / len(lst) if lst else 0
+        n = r["count"]
+        if not n: continue
         slabs.append(dict(label=sk[2], sort=sk[0], mm=round(r["rain"], 1),
-            pop=int(round(avg(r["pop"]), 0)), wind=round(avg(r["wind"]), 1),
-            vis=round(avg(r["vis"]), 1), hum=round(avg(r["hum"]), 1),
-            lightning=any(r["lightning"])))
+            pop=int(round(r["pop"] / n, 0)), wind=round(r["wind"] / n, 1),
+            vis=round(r["vis"] / n, 1), hum=round(r["hum"] / n, 1),
+            lightning=r["lightning"]))
     slabs.sort(key=lambda x: x["sort"])
     return slabs
 
@@ -647,20 +751,18 @@ def day_summary(hourly):
     if not hourly:
         return dict(max_temp="—", min_temp="—", total_rain=0, max_pop=0,
                     condition="—", humidity=0, slabs=[], max_wind=0, min_vis=10)
-    temps  = [d["temp"] for _, d in hourly]
-    rains  = [d["rain_mm"] for _, d in hourly]
-    pops   = [d["pop"] for _, d in hourly]
-    hums   = [d["humidity"] for _, d in hourly]
-    winds  = [d["wind_kmh"] for _, d in hourly]
-    viss   = [d["vis_km"] for _, d in hourly]
-    total  = round(sum(rains), 1)
-    descs  = [d["desc"] for _, d in hourly if d["desc"]]
+    # One pass into a contiguous float array, then C-level column reductions
+    # instead of six per-field list comprehensions + Python max/min/sum.
+    arr = np.array([(d["temp"], d["rain_mm"], d["pop"], d["humidity"],
+                     d["wind_kmh"], d["vis_km"]) for _, d in hourly])
+    total = round(float(arr[:, 1].sum()), 1)
+    descs = [d["desc"] for _, d in hourly if d["desc"]]
     return dict(
-        max_temp=round(max(temps), 1), min_temp=round(min(temps), 1),
-        total_rain=total, max_pop=int(round(max(pops), 0)),
+        max_temp=round(float(arr[:, 0].max()), 1), min_temp=round(float(arr[:, 0].min()), 1),
+        total_rain=total, max_pop=int(round(float(arr[:, 2].max()), 0)),
         condition=condition_str(total, descs),
-        humidity=round(sum(hums) / len(hums), 1) if hums else 0,
-        max_wind=round(max(winds), 1), min_vis=round(min(viss), 1),
+        humidity=round(float(arr[:, 3].mean()), 1),
+        max_wind=round(float(arr[:, 4].max()), 1), min_vis=round(float(arr[:, 5].min()), 1),
         slabs=build_slabs(hourly))
 
 # ══════════════════════════════════════════════════════════════
@@ -719,7 +821,7 @@ def rain_accum(hourly, target_day=None):
     if target_day is None or target_day == today_d:
         anchor = ist_now.replace(minute=0, second=0, microsecond=0)
     else:
-        anchor = IST.localize(datetime(target_day.year, target_day.month, target_day.day, 0, 0, 0))
+        anchor = datetime(target_day.year, target_day.month, target_day.day, 0, 0, 0, tzinfo=IST)
     out = {}
     for h in (2, 4, 6, 12, 24):
         seg = [(dt, d) for dt, d in hourly if anchor <= dt < anchor + timedelta(hours=h)]
@@ -994,7 +1096,8 @@ def render_sidebar():
     st.markdown(_HR, unsafe_allow_html=True)
 
     # ── Edit Site ──
-    active_obj = next((s for s in sites if s["name"] == st.session_state.active_site), None)
+    site_by_name = {s["name"]: s for s in sites}
+    active_obj = site_by_name.get(st.session_state.active_site)
     with st.expander("✏️  Edit selected site", expanded=False):
         if active_obj and active_obj.get("builtin"):
             st.info("Suliyari is a built-in site and cannot be edited.")
@@ -1168,7 +1271,7 @@ components.html(
     height=0
 )
 
-site = next((s for s in ALL_SITES if s["name"] == st.session_state.active_site), None)
+site = SITE_BY_NAME.get(st.session_state.active_site)
 if not site:
     st.markdown('<div class="wim-alert wim-alert-none"><div class="wim-alert-label">Site not found</div>Please select another site.</div>', unsafe_allow_html=True)
     st.stop()
@@ -1229,15 +1332,16 @@ for tab, tday in zip(st.tabs(tab_lbls), tab_days):
                 "wim-alert-low" if rain_t > 0 else "wim-alert-none")
         st.markdown(f'<div class="wim-alert {acss}"><div class="wim-alert-label">Forecast Advisory — Mining Operations</div>{rec}</div>', unsafe_allow_html=True)
 
-        # Summary Metrics
-        mcols = st.columns(7)
-        for col, (lbl, val) in zip(mcols, [
-            ("Condition", ds["condition"]), ("Max Temp", f"{ds['max_temp']}°C"),
-            ("Min Temp", f"{ds['min_temp']}°C"), ("Total Rain", f"{ds['total_rain']} mm"),
-            ("Rain Prob.", f"{ds['max_pop']}%"), ("Max Wind", f"{ds['max_wind']} km/h"),
-            ("Min Vis.", f"{ds['min_vis']} km"),
-        ]):
-            col.markdown(f'<div class="wim-metric"><div class="wim-metric-label">{lbl}</div><div class="wim-metric-value">{val}</div></div>', unsafe_allow_html=True)
+        # Summary Metrics — one grid element instead of seven column widgets
+        metric_cells = "".join(
+            f'<div class="wim-metric"><div class="wim-metric-label">{lbl}</div><div class="wim-metric-value">{val}</div></div>'
+            for lbl, val in [
+                ("Condition", ds["condition"]), ("Max Temp", f"{ds['max_temp']}°C"),
+                ("Min Temp", f"{ds['min_temp']}°C"), ("Total Rain", f"{ds['total_rain']} mm"),
+                ("Rain Prob.", f"{ds['max_pop']}%"), ("Max Wind", f"{ds['max_wind']} km/h"),
+                ("Min Vis.", f"{ds['min_vis']} km"),
+            ])
+        st.markdown(f'<div style="display:grid;grid-template-columns:repeat(7,1fr);gap:12px;">{metric_cells}</div>', unsafe_allow_html=True)
 
         # MinuteCast (today only)
         if tday == today and mc_data:
@@ -1248,17 +1352,18 @@ for tab, tday in zip(st.tabs(tab_lbls), tab_days):
         acc = rain_accum(dh, target_day=tday)
         pfx = "Next" if tday == today else "First"
         st.markdown(f'<div class="wim-section">Rainfall Accumulation{"" if tday == today else " — From Midnight"}</div>', unsafe_allow_html=True)
-        acols = st.columns(5)
-        for idx, h in enumerate([2, 4, 6, 12, 24]):
+        accum_cells = ""
+        for h in (2, 4, 6, 12, 24):
             mm, pop = acc[h]
             css, risk, rc = (("acc-high", "High Risk", "risk-high") if mm >= 15 else
                              ("acc-watch", "Monitor", "risk-watch") if mm >= 5 else
                              ("acc-safe", "Safe", "risk-safe"))
-            acols[idx].markdown(
+            accum_cells += (
                 f'<div class="wim-accum {css}"><div class="wim-accum-period">{pfx} {h}h</div>'
                 f'<div class="wim-accum-val">{mm} mm</div>'
                 f'<div class="wim-accum-pop">{pop}% probability</div>'
-                f'<div class="wim-accum-risk {rc}">{risk}</div></div>', unsafe_allow_html=True)
+                f'<div class="wim-accum-risk {rc}">{risk}</div></div>')
+        st.markdown(f'<div style="display:grid;grid-template-columns:repeat(5,1fr);gap:12px;">{accum_cells}</div>', unsafe_allow_html=True)
 
         # 2-Hour Slab Windows
         st.markdown('<div class="wim-section">2-Hour Precipitation Windows</div>', unsafe_allow_html=True)
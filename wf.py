@@ -1,9 +1,20 @@
 import os
+import bisect
+import concurrent.futures
+import functools
+import heapq
+import re
+import sys
+import tempfile
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-import pytz
+from zoneinfo import ZoneInfo
 import collections
+import numpy as np
+import orjson
+import pandas as pd
 
 # Load environment variables from .env file
 load_dotenv()
@@ -28,17 +39,104 @@ MINE_LOCATIONS = [
      "accuweather_location_key": os.getenv("LOCATION_KEY5")},
 ]
 
-# Timezone definitions
-IST = pytz.timezone('Asia/Kolkata')
-UTC = pytz.utc
+# Timezone definitions (zoneinfo attaches directly via tzinfo= — no
+# per-datetime localize step like pytz required)
+IST = ZoneInfo('Asia/Kolkata')
+UTC = ZoneInfo('UTC')
 REQUEST_TIMEOUT = 10
 
+# Shared HTTP session so the ~4 calls per mine (and repeat calls across mines)
+# reuse TCP/TLS connections instead of paying a fresh handshake each time.
+# When requests-cache is installed it becomes an on-disk cache too: repeat runs
+# inside the expiry window are served locally, and stale entries revalidate
+# with If-None-Match/If-Modified-Since so a 304 skips the body transfer.
+try:
+    import requests_cache
+    _SESSION = requests_cache.CachedSession(
+        cache_name=os.path.join(tempfile.gettempdir(), "wf_http_cache"),
+        backend="sqlite",
+        expire_after=300,
+        cache_control=True,
+    )
+except ImportError:
+    _SESSION = requests.Session()
+# Retry transient failures (429 and upstream 5xx) with a short exponential
+# backoff instead of dropping the whole mine's data on one bad response.
+_adapter = HTTPAdapter(
+    pool_connections=8, pool_maxsize=16,
+    max_retries=requests.adapters.Retry(
+        total=3, backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=["GET"],
+    ),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+
+def _get_json(url):
+    """GET a URL through the shared session and decode the JSON body"""
+    response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+# 2-hour time slabs for the day, in chronological order. Index i covers hours
+# [2i, 2i+2), with the last slab taking 22:00-24:00.
+SLAB_DEFINITIONS = [
+    (0, 2, "12:30 AM to 02:30 AM"),
+    (2, 4, "02:30 AM to 04:30 AM"),
+    (4, 6, "04:30 AM to 06:30 AM"),
+    (6, 8, "06:30 AM to 08:30 AM"),
+    (8, 10, "08:30 AM to 10:30 AM"),
+    (10, 12, "10:30 AM to 12:30 PM"),
+    (12, 14, "12:30 PM to 02:30 PM"),
+    (14, 16, "02:30 PM to 04:30 PM"),
+    (16, 18, "04:30 PM to 06:30 PM"),
+    (18, 20, "06:30 PM to 08:30 PM"),
+    (20, 22, "08:30 PM to 10:30 PM"),
+    (22, 2, "10:30 PM to 12:30 AM (Next Day)"),
+]
+
 # Threshold values for alerts
 WIND_ALERT_THRESHOLD_KMH = 30
 VISIBILITY_ALERT_THRESHOLD_KM = 1.0
 MIN_RAINFALL_FOR_SLAB_DISPLAY_MM = 0.6
 MAX_SLABS_TO_SHOW = 6
 
+# Keyword -> display label for the no-rain description fallback; one regex
+# scan replaces the chain of substring searches.
+_DESC_RE = re.compile(r'(thunderstorm|storm|clear|sun|cloud|overcast|fog|mist|rain)', re.IGNORECASE)
+_DESC_MAP = {
+    'thunderstorm': "Thunderstorm ⚡", 'storm': "Thunderstorm ⚡",
+    'clear': "Sunny ☀️", 'sun': "Sunny ☀️",
+    'cloud': "Cloudy ☁️", 'overcast': "Cloudy ☁️",
+    'fog': "Foggy 🌫️", 'mist': "Foggy 🌫️",
+    'rain': "Rainy ☔",
+}
+
+# Rainfall tiers as sorted thresholds for bisect; the mm == 0 case is handled
+# before the lookup. Same break points as EFS.py.
+_SLAB_RAIN_TIERS = ((0.3, 1.5, 5.0, 8.0),
+                    ("drizzle", "light rain", "moderate rain", "heavy rain",
+                     "very heavy rain (torrential)"))
+_DAILY_RAIN_TIERS = ((1.0, 5.0, 15.0, 25.0),
+                     ("Drizzle 💧", "Light Rain 🌦️", "Moderate Rain ☔",
+                      "Heavy Rain 🌧️", "Very Heavy Rain & Storm ⛈️"))
+# Slab records as a namedtuple: field access in the aggregation and report
+# loops is a C-level offset load instead of a dict hash per key.
+Slab = collections.namedtuple(
+    "Slab",
+    ["time_range", "sort_key", "prob", "mm", "type", "wind_speed",
+     "visibility_km", "lightning", "description"],
+)
+
+_RAIN_IMPACT_TIERS = ((5.0, 15.0), (
+    ("Low", "Normal operations, minor impact possible"),
+    ("Moderate", "Proceed with caution, production may be impacted due to moderate rainfall."),
+    ("High", "Production may be significantly impacted due to heavy rainfall."),
+))
+
 
 def get_rain_type(mm, is_2hr_slab=False, overall_description=None):
     """
@@ -46,60 +144,43 @@ def get_rain_type(mm, is_2hr_slab=False, overall_description=None):
     Different thresholds for 2-hour slabs vs daily totals.
     """
     if is_2hr_slab:
-        # Thresholds for 2-hour precipitation slabs
-        if mm >= 8: return "very heavy rain (torrential)"
-        elif mm >= 5: return "heavy rain"
-        elif mm >= 1.5: return "moderate rain"
-        elif mm >= 0.3: return "light rain"
-        elif mm > 0: return "drizzle"
-        else: return "no rain"
+        if mm <= 0:
+            return "no rain"
+        thresholds, labels = _SLAB_RAIN_TIERS
+        return labels[bisect.bisect_right(thresholds, mm)]
     else:
-        # Thresholds for overall daily precipitation
-        if mm >= 25: return "Very Heavy Rain & Storm ⛈️"
-        elif mm >= 15: return "Heavy Rain 🌧️"
-        elif mm >= 5: return "Moderate Rain ☔"
-        elif mm >= 1: return "Light Rain 🌦️"
-        elif mm > 0: return "Drizzle 💧"
-        else:
-            # Use weather description if no significant rain
-            if overall_description:
-                desc_lower = overall_description.lower()
-                if "clear" in desc_lower or "sun" in desc_lower: return "Sunny ☀️"
-                elif "cloud" in desc_lower or "overcast" in desc_lower: return "Cloudy ☁️"
-                elif "fog" in desc_lower or "mist" in desc_lower: return "Foggy 🌫️"
-                elif "thunderstorm" in desc_lower or "storm" in desc_lower: return "Thunderstorm ⚡"
-                elif "rain" in desc_lower: return "Rainy ☔"
-            return "No Rain ☀️"
+        if mm > 0:
+            thresholds, labels = _DAILY_RAIN_TIERS
+            return labels[bisect.bisect_right(thresholds, mm)]
+        # Use weather description if no significant rain
+        if overall_description:
+            match = _DESC_RE.search(overall_description)
+            if match:
+                return _DESC_MAP[match.group(1).lower()]
+        return "No Rain ☀️"
 
 
 def get_production_status(total_rain_mm, slabs):
     """
     Determine mining production impact based on rainfall and hazardous conditions.
     """
-    impact_level = "Low"
-    status_msg = "Normal operations, minor impact possible"
-    
     # Check rainfall impact
-    if total_rain_mm >= 15:
-        impact_level = "High"
-        status_msg = "Production may be significantly impacted due to heavy rainfall."
-    elif total_rain_mm >= 5:
-        impact_level = "Moderate"
-        status_msg = "Proceed with caution, production may be impacted due to moderate rainfall."
-    
+    thresholds, tiers = _RAIN_IMPACT_TIERS
+    impact_level, status_msg = tiers[bisect.bisect_right(thresholds, total_rain_mm)]
+
     # Check for hazardous conditions in slabs
     has_lightning = False
     has_high_wind = False
     has_low_visibility = False
-    
+
     for slab in slabs:
-        if slab['lightning']:
-            has_lightning = True
-        if slab['wind_speed'] >= WIND_ALERT_THRESHOLD_KMH:
-            has_high_wind = True
-        if slab['visibility_km'] <= VISIBILITY_ALERT_THRESHOLD_KM:
-            has_low_visibility = True
-    
+        has_lightning = has_lightning or slab.lightning
+        has_high_wind = has_high_wind or slab.wind_speed >= WIND_ALERT_THRESHOLD_KMH
+        has_low_visibility = has_low_visibility or slab.visibility_km <= VISIBILITY_ALERT_THRESHOLD_KM
+        if has_lightning and has_high_wind and has_low_visibility:
+            # Every hazard is already flagged; later slabs cannot add anything.
+            break
+
     # Adjust impact based on hazardous conditions
     if has_lightning:
         if impact_level != "High":
@@ -128,42 +209,66 @@ def get_production_status(total_rain_mm, slabs):
 def utc_to_ist(utc_dt):
     """Convert UTC datetime to IST timezone"""
     if utc_dt.tzinfo is None:
-        utc_dt = UTC.localize(utc_dt)
+        utc_dt = utc_dt.replace(tzinfo=UTC)
     return utc_dt.astimezone(IST)
 
 
+# Code -> description tables live at module scope so the lookup helpers do a
+# single dict .get instead of rebuilding the literal on every call.
+OPEN_METEO_WMO_CODES = {
+    0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
+    45: "Fog", 48: "Depositing rime fog",
+    51: "Drizzle: Light", 53: "Drizzle: Moderate", 55: "Drizzle: Dense",
+    56: "Freezing Drizzle: Light", 57: "Freezing Drizzle: Dense",
+    61: "Rain: Light", 63: "Rain: Moderate", 65: "Rain: Heavy",
+    66: "Freezing Rain: Light", 67: "Freezing Rain: Heavy",
+    71: "Snow fall: Slight", 73: "Snow fall: Moderate", 75: "Snow fall: Heavy",
+    77: "Snow grains",
+    80: "Rain showers: Slight", 81: "Rain showers: Moderate", 82: "Rain showers: Violent",
+    85: "Snow showers: Slight", 86: "Snow showers: Heavy",
+    95: "Thunderstorm: Slight or moderate",
+    96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
+}
+
+TOMORROW_IO_WMO_CODES = {
+    0: "Unknown", 1000: "Clear, Sunny", 1001: "Cloudy", 1100: "Mostly Clear",
+    1101: "Partly Cloudy", 1102: "Mostly Cloudy", 2000: "Fog", 2100: "Light Fog",
+    3000: "Light Wind", 3001: "Wind", 3002: "Strong Wind", 4000: "Drizzle",
+    4001: "Rain", 4200: "Light Rain", 4201: "Heavy Rain", 5000: "Light Snow",
+    5001: "Snow", 5100: "Heavy Snow", 5101: "Freezing Drizzle",
+    6000: "Freezing Drizzle", 6001: "Freezing Rain", 6200: "Light Freezing Rain",
+    6201: "Heavy Freezing Rain", 7000: "Light Ice Pellets", 7001: "Ice Pellets",
+    7100: "Heavy Ice Pellets", 8000: "Thunderstorm"
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _format_day(day):
+    """Format a date for the report header; every mine shares the same two days"""
+    return day.strftime("%d %B, %Y")
+
+
+def _most_common(values):
+    """Return the most frequent value; ties favour the first seen, like Counter.
+
+    Counting into a plain dict and taking max over its insertion order avoids
+    the Counter build + most_common sort at every aggregation site while
+    keeping Counter's tie-break.
+    """
+    counts = {}
+    for v in values:
+        counts[v] = counts.get(v, 0) + 1
+    return max(counts, key=counts.get) if counts else None
+
+
 def get_weather_description_from_wmo_open_meteo(code):
     """Map Open-Meteo WMO weather codes to readable descriptions"""
-    weather_codes = {
-        0: "Clear sky", 1: "Mainly clear", 2: "Partly cloudy", 3: "Overcast",
-        45: "Fog", 48: "Depositing rime fog",
-        51: "Drizzle: Light", 53: "Drizzle: Moderate", 55: "Drizzle: Dense",
-        56: "Freezing Drizzle: Light", 57: "Freezing Drizzle: Dense",
-        61: "Rain: Light", 63: "Rain: Moderate", 65: "Rain: Heavy",
-        66: "Freezing Rain: Light", 67: "Freezing Rain: Heavy",
-        71: "Snow fall: Slight", 73: "Snow fall: Moderate", 75: "Snow fall: Heavy",
-        77: "Snow grains",
-        80: "Rain showers: Slight", 81: "Rain showers: Moderate", 82: "Rain showers: Violent",
-        85: "Snow showers: Slight", 86: "Snow showers: Heavy",
-        95: "Thunderstorm: Slight or moderate",
-        96: "Thunderstorm with slight hail", 99: "Thunderstorm with heavy hail"
-    }
-    return weather_codes.get(code, "Unknown Open-Meteo code")
+    return OPEN_METEO_WMO_CODES.get(code, "Unknown Open-Meteo code")
 
 
 def get_weather_description_from_wmo_tomorrow_io(code):
     """Map Tomorrow.io weather codes to readable descriptions"""
-    tomorrow_io_weather_codes = {
-        0: "Unknown", 1000: "Clear, Sunny", 1001: "Cloudy", 1100: "Mostly Clear",
-        1101: "Partly Cloudy", 1102: "Mostly Cloudy", 2000: "Fog", 2100: "Light Fog",
-        3000: "Light Wind", 3001: "Wind", 3002: "Strong Wind", 4000: "Drizzle",
-        4001: "Rain", 4200: "Light Rain", 4201: "Heavy Rain", 5000: "Light Snow",
-        5001: "Snow", 5100: "Heavy Snow", 5101: "Freezing Drizzle",
-        6000: "Freezing Drizzle", 6001: "Freezing Rain", 6200: "Light Freezing Rain",
-        6201: "Heavy Freezing Rain", 7000: "Light Ice Pellets", 7001: "Ice Pellets",
-        7100: "Heavy Ice Pellets", 8000: "Thunderstorm"
-    }
-    return tomorrow_io_weather_codes.get(code, "Unknown Tomorrow.io code")
+    return TOMORROW_IO_WMO_CODES.get(code, "Unknown Tomorrow.io code")
 
 
 def fetch_openweather_forecast(lat, lon):
@@ -175,9 +280,7 @@ def fetch_openweather_forecast(lat, lon):
     try:
         url = (f"https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}"
                f"&units=metric&exclude=minutely,daily,alerts&appid={OPENWEATHER_KEY}")
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.json()
+        return _get_json(url)
     except requests.exceptions.RequestException as e:
         print(f"  OpenWeatherMap One Call API 3.0 Error for ({lat},{lon}): {e}")
         return None
@@ -189,14 +292,27 @@ def fetch_open_meteo_forecast(lat, lon):
         url = (f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}"
                f"&hourly=temperature_2m,precipitation,weather_code,wind_speed_10m,precipitation_probability,visibility"
                f"&forecast_days=2&timezone=Asia%2FKolkata")
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.json()
+        return _get_json(url)
     except requests.exceptions.RequestException as e:
         print(f"  Open-Meteo API Error for ({lat},{lon}): {e}")
         return None
 
 
+def fetch_open_meteo_batch(lats, lons):
+    """Fetch hourly forecasts for several coordinates in one Open-Meteo call"""
+    try:
+        url = (f"https://api.open-meteo.com/v1/forecast"
+               f"?latitude={','.join(map(str, lats))}&longitude={','.join(map(str, lons))}"
+               f"&hourly=temperature_2m,precipitation,weather_code,wind_speed_10m,precipitation_probability,visibility"
+               f"&forecast_days=2&timezone=Asia%2FKolkata")
+        data = _get_json(url)
+        # A single-coordinate request comes back as one dict, not a list
+        return data if isinstance(data, list) else [data]
+    except requests.exceptions.RequestException as e:
+        print(f"  Open-Meteo batch API Error: {e}")
+        return None
+
+
 def fetch_tomorrow_io_forecast(lat, lon):
     """Fetch weather forecast from Tomorrow.io using /weather/forecast endpoint"""
     if not TOMORROWIO_KEY:
@@ -206,9 +322,7 @@ def fetch_tomorrow_io_forecast(lat, lon):
     try:
         url = (f"https://api.tomorrow.io/v4/weather/forecast?location={lat},{lon}"
                f"&units=metric&apikey={TOMORROWIO_KEY}")
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.json()
+        return _get_json(url)
     except requests.exceptions.RequestException as e:
         print(f"  Tomorrow.io API Error for ({lat},{lon}): {e}")
         return None
@@ -226,9 +340,7 @@ def fetch_accuweather_daily_forecast(location_key):
     
     try:
         url = f"https://dataservice.accuweather.com/forecasts/v1/daily/5day/{location_key}?apikey={ACCUWEATHER_KEY}&details=true&metric=true"
-        response = requests.get(url, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        return response.json()
+        return _get_json(url)
     except requests.exceptions.RequestException as e:
         print(f"  AccuWeather Daily Forecast API Error for Location Key {location_key}: {e}")
         return None
@@ -244,115 +356,93 @@ def get_daily_summary_and_slabs(hourly_data_list):
         return {"max_temp": "N/A", "min_temp": "N/A", "total_rain": 0, "total_rain_pop": 0, 
                 "weather_desc": "N/A", "slabs": []}
     
-    max_temp = float("-inf")
-    min_temp = float("inf")
-    total_rain_overall = 0
+    # Load the hourly metrics into parallel NumPy arrays once; every reduction
+    # below is then a single C pass instead of per-hour Python arithmetic.
+    n = len(hourly_data_list)
+    temps = np.empty(n)
+    rains = np.empty(n)
+    pops = np.empty(n)
+    winds = np.empty(n)
+    vis = np.empty(n)
+    lightning = np.empty(n, dtype=bool)
+    slab_idx = np.empty(n, dtype=np.intp)
     all_weather_descs = []
-    all_hourly_pops = []
-    
-    # Define 2-hour time slabs for the day
-    SLAB_DEFINITIONS = [
-        (0, 2, "12:30 AM to 02:30 AM"),
-        (2, 4, "02:30 AM to 04:30 AM"),
-        (4, 6, "04:30 AM to 06:30 AM"),
-        (6, 8, "06:30 AM to 08:30 AM"),
-        (8, 10, "08:30 AM to 10:30 AM"),
-        (10, 12, "10:30 AM to 12:30 PM"),
-        (12, 14, "12:30 PM to 02:30 PM"),
-        (14, 16, "02:30 PM to 04:30 PM"),
-        (16, 18, "04:30 PM to 06:30 PM"),
-        (18, 20, "06:30 PM to 08:30 PM"),
-        (20, 22, "08:30 PM to 10:30 PM"),
-        (22, 2, "10:30 PM to 12:30 AM (Next Day)"),
-    ]
-    
-    slabs_data_raw = collections.defaultdict(lambda: {
-        "rain_mm": 0, "pop": [], "wind_speed": [], "visibility_km": [], 
-        "lightning": [], "descs": [], "hours_covered": 0
-    })
-    
-    # Process each hour of data
-    for dt_ist, data in hourly_data_list:
-        max_temp = max(max_temp, data['temp'])
-        min_temp = min(min_temp, data['temp'])
-        total_rain_overall += data['rain_mm']
+
+    for i, (dt_ist, data) in enumerate(hourly_data_list):
+        temps[i] = data['temp']
+        rains[i] = data['rain_mm']
+        pops[i] = data['pop']
+        winds[i] = data['wind_speed']
+        vis[i] = data.get('visibility_km', 10)
+        lightning[i] = data['lightning']
+        slab_idx[i] = min(dt_ist.hour // 2, 11)
         all_weather_descs.append(data['description'])
-        all_hourly_pops.append(data['pop'])
-        
-        hour_in_day = dt_ist.hour
-        slab_key = None
-        
-        # Find which 2-hour slab this hour belongs to
-        for start_h, end_h, display_name in SLAB_DEFINITIONS:
-            if start_h == 22 and end_h == 2:
-                if hour_in_day == 22 or hour_in_day == 23:
-                    slab_key = (start_h, end_h, display_name)
-                    break
-            elif start_h < end_h:
-                if hour_in_day >= start_h and hour_in_day < end_h:
-                    slab_key = (start_h, end_h, display_name)
-                    break
-        
-        # Aggregate data for this slab
-        if slab_key:
-            slabs_data_raw[slab_key]["rain_mm"] += data['rain_mm']
-            slabs_data_raw[slab_key]["pop"].append(data['pop'])
-            slabs_data_raw[slab_key]["wind_speed"].append(data['wind_speed'])
-            slabs_data_raw[slab_key]["visibility_km"].append(data.get('visibility_km', 10))
-            slabs_data_raw[slab_key]["descs"].append(data['description'])
-            slabs_data_raw[slab_key]["lightning"].append(data['lightning'])
-            slabs_data_raw[slab_key]["hours_covered"] += 1
-    
+
+    max_temp = float(temps.max())
+    min_temp = float(temps.min())
+    total_rain_overall = float(rains.sum())
+
+    # Per-slab sums via bincount over the slab index; counts give the averages.
+    n_slabs = len(SLAB_DEFINITIONS)
+    slab_hours = np.bincount(slab_idx, minlength=n_slabs)
+    slab_rain = np.bincount(slab_idx, weights=rains, minlength=n_slabs)
+    slab_pop = np.bincount(slab_idx, weights=pops, minlength=n_slabs)
+    slab_wind = np.bincount(slab_idx, weights=winds, minlength=n_slabs)
+    slab_vis = np.bincount(slab_idx, weights=vis, minlength=n_slabs)
+    slab_lightning = np.bincount(slab_idx, weights=lightning, minlength=n_slabs) > 0
+    slab_descs = [[] for _ in range(n_slabs)]
+    for idx, desc in zip(slab_idx, all_weather_descs):
+        slab_descs[idx].append(desc)
+
     # Process slabs into final format
     candidate_slabs = []
-    for slab_key, slab_data in slabs_data_raw.items():
-        if slab_data["hours_covered"] > 0:
-            avg_pop = sum(slab_data["pop"]) / len(slab_data["pop"]) if slab_data["pop"] else 0
-            avg_wind = sum(slab_data["wind_speed"]) / len(slab_data["wind_speed"]) if slab_data["wind_speed"] else 0
-            avg_vis = sum(slab_data["visibility_km"]) / len(slab_data["visibility_km"]) if slab_data["visibility_km"] else 10.0
-            main_desc = collections.Counter(slab_data["descs"]).most_common(1)[0][0] if slab_data["descs"] else get_rain_type(slab_data["rain_mm"], is_2hr_slab=True)
-            explicit_lightning_in_desc = any("thunder" in d.lower() or "lightning" in d.lower() for d in slab_data["descs"])
-            
-            # Only include slabs with meaningful rainfall
-            if slab_data["rain_mm"] >= MIN_RAINFALL_FOR_SLAB_DISPLAY_MM:
-                candidate_slabs.append({
-                    "time_range": slab_key[2],
-                    "sort_key": slab_data["rain_mm"] + (avg_pop / 100),
-                    "prob": int(round(avg_pop, 0)),
-                    "mm": round(slab_data["rain_mm"], 1),
-                    "type": get_rain_type(slab_data["rain_mm"], is_2hr_slab=True),
-                    "wind_speed": round(avg_wind, 1),
-                    "visibility_km": round(avg_vis, 1),
-                    "lightning": any(slab_data["lightning"]) or explicit_lightning_in_desc,
-                    "description": main_desc
-                })
-    
-    # Sort slabs by rain amount, then select top ones
-    candidate_slabs.sort(key=lambda x: (-x["sort_key"], x["time_range"]))
-    
-    final_slabs = []
-    seen_time_ranges = set()
-    for slab in candidate_slabs:
-        if slab["time_range"] not in seen_time_ranges:
-            final_slabs.append(slab)
-            seen_time_ranges.add(slab["time_range"])
-            if len(final_slabs) >= MAX_SLABS_TO_SHOW:
-                break
+    for idx, (start_h, end_h, display_name) in enumerate(SLAB_DEFINITIONS):
+        hours_covered = int(slab_hours[idx])
+        rain_mm = float(slab_rain[idx])
+        # Only include slabs with meaningful rainfall
+        if hours_covered == 0 or rain_mm < MIN_RAINFALL_FOR_SLAB_DISPLAY_MM:
+            continue
+
+        avg_pop = slab_pop[idx] / hours_covered
+        avg_wind = slab_wind[idx] / hours_covered
+        avg_vis = slab_vis[idx] / hours_covered
+        descs = slab_descs[idx]
+        main_desc = _most_common(descs) if descs else get_rain_type(rain_mm, is_2hr_slab=True)
+
+        candidate_slabs.append(Slab(
+            time_range=display_name,
+            sort_key=rain_mm + (avg_pop / 100),
+            prob=int(round(avg_pop, 0)),
+            mm=round(rain_mm, 1),
+            type=get_rain_type(rain_mm, is_2hr_slab=True),
+            wind_speed=round(avg_wind, 1),
+            visibility_km=round(avg_vis, 1),
+            # Thunder codes set the flag at ingestion (OpenWeatherMap 2xx ids,
+            # Open-Meteo 95/96/99, Tomorrow.io 8000), so no description scan
+            # is needed here.
+            lightning=bool(slab_lightning[idx]),
+            description=main_desc,
+        ))
     
+    # Candidates are built one-per-slab from the fixed buckets, so each time
+    # range already appears exactly once. nlargest takes the rainiest few in
+    # O(n log k) and, being stable, breaks ties chronologically.
+    final_slabs = heapq.nlargest(MAX_SLABS_TO_SHOW, candidate_slabs, key=lambda x: x.sort_key)
+
     # Sort selected slabs chronologically for display
     slab_order_map = {s[2]: idx for idx, s in enumerate(SLAB_DEFINITIONS)}
-    final_slabs.sort(key=lambda x: slab_order_map.get(x["time_range"], float('inf')))
+    final_slabs.sort(key=lambda x: slab_order_map.get(x.time_range, float('inf')))
     
     # Determine overall weather description
-    overall_raw_desc = collections.Counter(all_weather_descs).most_common(1)[0][0] if all_weather_descs else "N/A"
+    overall_raw_desc = _most_common(all_weather_descs) or "N/A"
     overall_weather_desc_with_icon = get_rain_type(total_rain_overall, is_2hr_slab=False, overall_description=overall_raw_desc)
     
     # Get maximum hourly probability of precipitation
-    max_hourly_pop = max(all_hourly_pops) if all_hourly_pops else 0
-    
+    max_hourly_pop = float(pops.max())
+
     return {
-        "max_temp": round(max_temp, 1) if max_temp != float("-inf") else "N/A",
-        "min_temp": round(min_temp, 1) if min_temp != float("inf") else "N/A",
+        "max_temp": round(max_temp, 1),
+        "min_temp": round(min_temp, 1),
         "total_rain": round(total_rain_overall, 1),
         "total_rain_pop": int(round(max_hourly_pop, 0)),
         "weather_desc": overall_weather_desc_with_icon,
@@ -360,65 +450,88 @@ def get_daily_summary_and_slabs(hourly_data_list):
     }
 
 
-def fetch_and_print_forecast(lat, lon, mine_name, accuweather_location_key):
+def fetch_and_print_forecast(lat, lon, mine_name, accuweather_location_key, om_data=None):
     """
     Main function to fetch weather data from multiple APIs, consolidate it,
-    and print a comprehensive forecast for a mine location.
+    and return a comprehensive forecast report for a mine location.
+
+    The report is returned as one string (rather than printed directly) so
+    mines can be processed concurrently without interleaving their output.
     """
-    print(f"\n✨ Fetching detailed forecast for {mine_name} (Lat: {lat}, Lon: {lon})...")
-    
-    # Fetch data from all available APIs
-    ow_data = fetch_openweather_forecast(lat, lon)
-    om_data = fetch_open_meteo_forecast(lat, lon)
-    tm_data = fetch_tomorrow_io_forecast(lat, lon)
-    aw_daily_data = fetch_accuweather_daily_forecast(accuweather_location_key)
+    lines = [f"\n✨ Fetching detailed forecast for {mine_name} (Lat: {lat}, Lon: {lon})..."]
+    
+    # Fetch from all four APIs in parallel — they are independent, so the wait
+    # is the slowest single round-trip instead of the sum of four.
+    # om_data may already be supplied from the batched all-mines call; only
+    # fall back to a per-mine Open-Meteo request when it is not.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        ow_future = executor.submit(fetch_openweather_forecast, lat, lon)
+        om_future = None if om_data is not None else executor.submit(fetch_open_meteo_forecast, lat, lon)
+        tm_future = executor.submit(fetch_tomorrow_io_forecast, lat, lon)
+        aw_future = executor.submit(fetch_accuweather_daily_forecast, accuweather_location_key)
+        ow_data = ow_future.result()
+        if om_future is not None:
+            om_data = om_future.result()
+        tm_data = tm_future.result()
+        aw_daily_data = aw_future.result()
     
     # Check if any primary data source is available
     if not any([ow_data, om_data, tm_data]):
-        print(f"📍 {mine_name} - ⚠️ No primary forecast data available from OpenWeatherMap, Open-Meteo, or Tomorrow.io. Please check API keys and network connectivity.")
-        print(f"\n{'-'*60}")
-        return
-    
-    # Dictionary to consolidate hourly data from multiple sources
-    hourly_consolidated = {}
-    
+        lines.append(f"📍 {mine_name} - ⚠️ No primary forecast data available from OpenWeatherMap, Open-Meteo, or Tomorrow.io. Please check API keys and network connectivity.")
+        lines.append(f"\n{'-'*60}")
+        return "\n".join(lines)
+    
+    # Accepted forecast window, computed once: the ingestion loops below compare
+    # every hourly entry against these bounds.
+    now_hour = datetime.now(IST).replace(minute=0, second=0, microsecond=0)
+    window_start = now_hour - timedelta(hours=1)
+    window_end = now_hour + timedelta(hours=48)
+    current_date_ist = now_hour.date()
+
+    # Consolidated hourly data as one (hours x sources) block per metric,
+    # indexed by the hour's offset from window_start — no per-entry dict or
+    # list allocations. Columns: 0 = OpenWeatherMap, 1 = Open-Meteo,
+    # 2 = Tomorrow.io; NaN marks "this source had no data for this hour".
+    N_HOURS = 50
+    N_SOURCES = 3
+    temp_grid = np.full((N_HOURS, N_SOURCES), np.nan)
+    rain_grid = np.full((N_HOURS, N_SOURCES), np.nan)
+    pop_grid = np.full((N_HOURS, N_SOURCES), np.nan)
+    wind_grid = np.full((N_HOURS, N_SOURCES), np.nan)
+    vis_grid = np.full((N_HOURS, N_SOURCES), np.nan)
+    lightning_grid = np.zeros((N_HOURS, N_SOURCES), dtype=bool)
+    desc_grid = [[] for _ in range(N_HOURS)]
+
     # AccuWeather daily data storage (not used in current print format)
     accuweather_daily_consolidated = {}
     
     # Process OpenWeatherMap hourly data
     if ow_data and "hourly" in ow_data:
-        for entry in ow_data["hourly"]:
-            dt_utc = datetime.fromtimestamp(entry["dt"], tz=UTC)
-            dt_ist = utc_to_ist(dt_utc)
-            hour_key = dt_ist.replace(minute=0, second=0, microsecond=0)
-            
+        entries = ow_data["hourly"]
+        # Convert every epoch stamp to an IST hour in one vectorized call
+        ow_hour_keys = pd.to_datetime(
+            [entry["dt"] for entry in entries], unit='s', utc=True
+        ).tz_convert(IST).floor('h').to_pydatetime()
+        for hour_key, entry in zip(ow_hour_keys, entries):
+
             # Filter to relevant forecast window (current hour to +48 hours)
-            if hour_key < datetime.now(IST).replace(minute=0, second=0, microsecond=0) - timedelta(hours=1) or \
-               hour_key > datetime.now(IST).replace(minute=0, second=0, microsecond=0) + timedelta(hours=48):
+            if hour_key < window_start or hour_key > window_end:
                 continue
-            
-            hourly_consolidated.setdefault(hour_key, {
-                'temp': [], 'rain_mm': [], 'pop': [], 'wind_speed': [],
-                'visibility_km': [], 'description': [], 'lightning': []
-            })
-            
-            hourly_consolidated[hour_key]['temp'].append(entry["temp"])
+            off = int((hour_key - window_start).total_seconds() // 3600)
+
+            temp_grid[off, 0] = entry["temp"]
             rain_mm = entry.get("rain", {}).get("1h", 0)
             snow_mm = entry.get("snow", {}).get("1h", 0)
-            hourly_consolidated[hour_key]['rain_mm'].append(rain_mm + snow_mm)
-            hourly_consolidated[hour_key]['pop'].append(entry.get("pop", 0) * 100)
-            hourly_consolidated[hour_key]['wind_speed'].append(entry["wind_speed"] * 3.6)
-            hourly_consolidated[hour_key]['visibility_km'].append(entry.get("visibility", 10000) / 1000)
-            
+            rain_grid[off, 0] = rain_mm + snow_mm
+            pop_grid[off, 0] = entry.get("pop", 0) * 100
+            wind_grid[off, 0] = entry["wind_speed"] * 3.6
+            vis_grid[off, 0] = entry.get("visibility", 10000) / 1000
+
             if entry.get("weather"):
-                hourly_consolidated[hour_key]['description'].append(entry["weather"][0]["description"])
-                if 200 <= entry["weather"][0]["id"] < 300:
-                    hourly_consolidated[hour_key]['lightning'].append(True)
-                else:
-                    hourly_consolidated[hour_key]['lightning'].append(False)
+                desc_grid[off].append(entry["weather"][0]["description"])
+                lightning_grid[off, 0] = 200 <= entry["weather"][0]["id"] < 300
             else:
-                hourly_consolidated[hour_key]['description'].append("N/A")
-                hourly_consolidated[hour_key]['lightning'].append(False)
+                desc_grid[off].append("N/A")
     
     # Process Open-Meteo hourly data
     if om_data and "hourly" in om_data:
@@ -430,77 +543,64 @@ def fetch_and_print_forecast(lat, lon, mine_name, accuweather_location_key):
         pops = om_data["hourly"]["precipitation_probability"]
         visibilities = om_data["hourly"].get("visibility", [])
         
-        for i, time_str in enumerate(times):
-            dt_ist = datetime.fromisoformat(time_str).replace(tzinfo=IST)
-            hour_key = dt_ist.replace(minute=0, second=0, microsecond=0)
-            
-            if hour_key < datetime.now(IST).replace(minute=0, second=0, microsecond=0) - timedelta(hours=1) or \
-               hour_key > datetime.now(IST).replace(minute=0, second=0, microsecond=0) + timedelta(hours=48):
+        # Open-Meteo returns a contiguous hourly series in IST wall-clock time
+        # (timezone=Asia/Kolkata in the request), so parse and localize the
+        # first stamp once and step it arithmetically — IST has no DST, making
+        # the fixed-offset addition safe.
+        base_hour = datetime.fromisoformat(times[0]).replace(
+            minute=0, second=0, microsecond=0, tzinfo=IST
+        ) if times else None
+        for i in range(len(times)):
+            hour_key = base_hour + timedelta(hours=i)
+
+            if hour_key < window_start or hour_key > window_end:
                 continue
-            
-            hourly_consolidated.setdefault(hour_key, {
-                'temp': [], 'rain_mm': [], 'pop': [], 'wind_speed': [],
-                'visibility_km': [], 'description': [], 'lightning': []
-            })
-            
-            hourly_consolidated[hour_key]['temp'].append(temps[i])
-            hourly_consolidated[hour_key]['rain_mm'].append(precipitations[i])
-            hourly_consolidated[hour_key]['pop'].append(pops[i])
-            hourly_consolidated[hour_key]['wind_speed'].append(wind_speeds[i])
-            hourly_consolidated[hour_key]['visibility_km'].append(visibilities[i]/1000 if visibilities else 10)
-            hourly_consolidated[hour_key]['description'].append(get_weather_description_from_wmo_open_meteo(weather_codes[i]))
-            
-            if weather_codes[i] in [95, 96, 99]:
-                hourly_consolidated[hour_key]['lightning'].append(True)
-            else:
-                hourly_consolidated[hour_key]['lightning'].append(False)
+            off = int((hour_key - window_start).total_seconds() // 3600)
+
+            temp_grid[off, 1] = temps[i]
+            rain_grid[off, 1] = precipitations[i]
+            pop_grid[off, 1] = pops[i]
+            wind_grid[off, 1] = wind_speeds[i]
+            vis_grid[off, 1] = visibilities[i] / 1000 if visibilities else 10
+            desc_grid[off].append(get_weather_description_from_wmo_open_meteo(weather_codes[i]))
+            lightning_grid[off, 1] = weather_codes[i] in (95, 96, 99)
     
     # Process Tomorrow.io hourly data
     if tm_data and "timelines" in tm_data and "hourly" in tm_data["timelines"]:
-        for interval in tm_data["timelines"]["hourly"]:
-            dt_iso_str = interval["time"]
-            dt_utc_naive = datetime.strptime(dt_iso_str, '%Y-%m-%dT%H:%M:%SZ')
-            dt_utc_aware = UTC.localize(dt_utc_naive)
-            dt_ist = dt_utc_aware.astimezone(IST)
-            hour_key = dt_ist.replace(minute=0, second=0, microsecond=0)
-            
-            if hour_key < datetime.now(IST).replace(minute=0, second=0, microsecond=0) - timedelta(hours=1) or \
-               hour_key > datetime.now(IST).replace(minute=0, second=0, microsecond=0) + timedelta(hours=48):
+        intervals = tm_data["timelines"]["hourly"]
+        # Batch-parse the ISO stamps instead of strptime + astimezone each
+        tm_hour_keys = pd.to_datetime(
+            [interval["time"] for interval in intervals],
+            format='%Y-%m-%dT%H:%M:%SZ', utc=True
+        ).tz_convert(IST).floor('h').to_pydatetime()
+        for hour_key, interval in zip(tm_hour_keys, intervals):
+
+            if hour_key < window_start or hour_key > window_end:
                 continue
-            
+            off = int((hour_key - window_start).total_seconds() // 3600)
+
             values = interval["values"]
-            
-            hourly_consolidated.setdefault(hour_key, {
-                'temp': [], 'rain_mm': [], 'pop': [], 'wind_speed': [],
-                'visibility_km': [], 'description': [], 'lightning': []
-            })
-            
-            hourly_consolidated[hour_key]['temp'].append(values.get("temperature", 0))
-            hourly_consolidated[hour_key]['rain_mm'].append(values.get("precipitationIntensity", 0))
-            hourly_consolidated[hour_key]['pop'].append(values.get("precipitationProbability", 0))
-            hourly_consolidated[hour_key]['wind_speed'].append(values.get("windSpeed", 0) * 3.6)
-            hourly_consolidated[hour_key]['visibility_km'].append(values.get("visibility", 10000) / 1000)
-            
+
+            temp_grid[off, 2] = values.get("temperature", 0)
+            rain_grid[off, 2] = values.get("precipitationIntensity", 0)
+            pop_grid[off, 2] = values.get("precipitationProbability", 0)
+            wind_grid[off, 2] = values.get("windSpeed", 0) * 3.6
+            vis_grid[off, 2] = values.get("visibility", 10000) / 1000
+
             tm_weather_code = values.get("weatherCode")
             if tm_weather_code is not None:
-                hourly_consolidated[hour_key]['description'].append(get_weather_description_from_wmo_tomorrow_io(tm_weather_code))
+                desc_grid[off].append(get_weather_description_from_wmo_tomorrow_io(tm_weather_code))
             else:
-                hourly_consolidated[hour_key]['description'].append("N/A")
-            
-            if values.get("lightningStrikeCount", 0) > 0 or tm_weather_code == 8000:
-                hourly_consolidated[hour_key]['lightning'].append(True)
-            else:
-                hourly_consolidated[hour_key]['lightning'].append(False)
+                desc_grid[off].append("N/A")
+
+            lightning_grid[off, 2] = values.get("lightningStrikeCount", 0) > 0 or tm_weather_code == 8000
     
     # Process AccuWeather daily data (fetched but not used in print output)
     if aw_daily_data and "DailyForecasts" in aw_daily_data:
         for daily_entry in aw_daily_data["DailyForecasts"]:
             dt_epoch = daily_entry["EpochDate"]
-            dt_utc = datetime.fromtimestamp(dt_epoch, tz=UTC)
-            dt_ist = utc_to_ist(dt_utc)
-            day_key = dt_ist.date()
+            day_key = datetime.fromtimestamp(dt_epoch, tz=IST).date()
             
-            current_date_ist = datetime.now(IST).date()
             if day_key < current_date_ist or day_key > current_date_ist + timedelta(days=1):
                 continue
             
@@ -513,28 +613,28 @@ def fetch_and_print_forecast(lat, lon, mine_name, accuweather_location_key):
             accuweather_daily_consolidated[day_key]['total_rain'].append(daily_entry["Day"]["TotalLiquid"]["Value"])
             accuweather_daily_consolidated[day_key]['description'].append(daily_entry["Day"]["IconPhrase"])
     
-    # Aggregate consolidated hourly data
+    # Aggregate consolidated hourly data. Every ingestion branch writes all
+    # five metrics, so an hour's source count is the number of non-NaN temp
+    # cells, and each average is a row sum divided by that count. Offsets are
+    # already chronological, so no sort is needed.
     final_hourly_data = []
-    sorted_hour_keys = sorted(hourly_consolidated.keys())
-    
-    for hour_key in sorted_hour_keys:
-        aggregated_data = hourly_consolidated[hour_key]
-        
-        # Calculate averages from all API sources
-        avg_temp = sum(aggregated_data['temp']) / len(aggregated_data['temp']) if aggregated_data['temp'] else 0
-        # Average rain to prevent overestimation from multiple sources
-        avg_rain = sum(aggregated_data['rain_mm']) / len(aggregated_data['rain_mm']) if aggregated_data['rain_mm'] else 0
-        avg_pop = sum(aggregated_data['pop']) / len(aggregated_data['pop']) if aggregated_data['pop'] else 0
-        avg_wind_speed = sum(aggregated_data['wind_speed']) / len(aggregated_data['wind_speed']) if aggregated_data['wind_speed'] else 0
-        avg_visibility_km = sum(aggregated_data['visibility_km']) / len(aggregated_data['visibility_km']) if aggregated_data['visibility_km'] else 10.0
-        
+    source_counts = (~np.isnan(temp_grid)).sum(axis=1)
+
+    for off in np.flatnonzero(source_counts):
+        hour_key = window_start + timedelta(hours=int(off))
+        n_sources = source_counts[off]
+
+        # Calculate averages from all API sources (rain is averaged rather
+        # than summed to prevent overestimation from multiple sources)
+        avg_temp = np.nansum(temp_grid[off]) / n_sources
+        avg_rain = np.nansum(rain_grid[off]) / n_sources
+        avg_pop = np.nansum(pop_grid[off]) / n_sources
+        avg_wind_speed = np.nansum(wind_grid[off]) / n_sources
+        avg_visibility_km = np.nansum(vis_grid[off]) / n_sources
+
         # Get most common weather description
-        most_common_desc = collections.Counter(aggregated_data['description']).most_common(1)
-        hourly_description = most_common_desc[0][0] if most_common_desc else "N/A"
-        
-        # If any source predicts lightning, mark it true
-        has_lightning = any(aggregated_data['lightning'])
-        
+        hourly_description = _most_common(desc_grid[off]) or "N/A"
+
         final_hourly_data.append((
             hour_key,
             {
@@ -544,66 +644,65 @@ def fetch_and_print_forecast(lat, lon, mine_name, accuweather_location_key):
                 'wind_speed': avg_wind_speed,
                 'visibility_km': avg_visibility_km,
                 'description': hourly_description,
-                'lightning': has_lightning
+                # If any source predicts lightning, mark it true
+                'lightning': bool(lightning_grid[off].any())
             }
         ))
     
-    # Group hourly data by day
+    # Group hourly data by day, keeping only today and tomorrow up front so
+    # hours from days that are never displayed are not aggregated at all.
+    displayed_days = (current_date_ist, current_date_ist + timedelta(days=1))
     forecast_by_day = collections.defaultdict(list)
     for dt_ist, data in final_hourly_data:
         day_key = dt_ist.date()
-        forecast_by_day[day_key].append((dt_ist, data))
-    
-    sorted_days = sorted(forecast_by_day.keys())
-    
-    # Print daily summaries and precipitation slabs
-    current_date_ist = datetime.now(IST).date()
-    for day in sorted_days:
-        # Only display today and tomorrow
-        if day < current_date_ist or day > current_date_ist + timedelta(days=1):
-            continue
-        
-        day_hourly_data = forecast_by_day[day]
+        if day_key in displayed_days:
+            forecast_by_day[day_key].append((dt_ist, data))
+
+    # Report daily summaries and precipitation slabs. final_hourly_data is
+    # chronological, so dict insertion order already walks the days in order
+    # and no key sort is needed.
+    for day, day_hourly_data in forecast_by_day.items():
         day_summary = get_daily_summary_and_slabs(day_hourly_data)
-        
+
         day_label = "Today" if day == current_date_ist else "Tomorrow"
-        date_str = day.strftime("%d %B, %Y")
-        
-        print(f"\n📍 {mine_name} - Forecast for {day_label}, {date_str}")
-        print(f"\t• Weather: {day_summary['weather_desc']}")
-        print(f"\t• Max Temp: {day_summary['max_temp']}°C")
-        print(f"\t• Min Temp: {day_summary['min_temp']}°C")
-        print(f"\t• Total Expected Rainfall: {day_summary['total_rain']} mm")
-        print(f"\t• Rainfall probability: {day_summary['total_rain_pop']}%")
-        
+        date_str = _format_day(day)
+
+        lines.append(f"\n📍 {mine_name} - Forecast for {day_label}, {date_str}")
+        lines.append(f"\t• Weather: {day_summary['weather_desc']}")
+        lines.append(f"\t• Max Temp: {day_summary['max_temp']}°C")
+        lines.append(f"\t• Min Temp: {day_summary['min_temp']}°C")
+        lines.append(f"\t• Total Expected Rainfall: {day_summary['total_rain']} mm")
+        lines.append(f"\t• Rainfall probability: {day_summary['total_rain_pop']}%")
+
         # Display precipitation slabs if available
         if day_summary['slabs']:
-            print("\n\tPrecipitation Info:")
+            lines.append("\n\tPrecipitation Info:")
             for slab in day_summary['slabs']:
-                wind_alert = " ⚠️" if slab['wind_speed'] >= WIND_ALERT_THRESHOLD_KMH else ""
-                visibility_alert = " ⚠️" if slab['visibility_km'] <= VISIBILITY_ALERT_THRESHOLD_KM else ""
-                
-                print(f"\t• {slab['time_range']} - {slab['prob']}%, {slab['mm']} mm ({slab['type']})")
-                
-                alerts = []
-                if slab['lightning']:
-                    alerts.append("⚡ Lightning expected")
-                if wind_alert:
-                    alerts.append(f"{wind_alert} High Wind ({slab['wind_speed']} km/h)")
-                if visibility_alert:
-                    alerts.append(f"{visibility_alert} Low Visibility ({slab['visibility_km']} km)")
-                
-                if alerts:
-                    print(f"\t  {' | '.join(alerts)}")
+                high_wind = slab.wind_speed >= WIND_ALERT_THRESHOLD_KMH
+                low_visibility = slab.visibility_km <= VISIBILITY_ALERT_THRESHOLD_KM
+
+                lines.append(f"\t• {slab.time_range} - {slab.prob}%, {slab.mm} mm ({slab.type})")
+
+                # Most slabs carry no alert — skip building the list entirely
+                if slab.lightning or high_wind or low_visibility:
+                    alerts = []
+                    if slab.lightning:
+                        alerts.append("⚡ Lightning expected")
+                    if high_wind:
+                        alerts.append(f" ⚠️ High Wind ({slab.wind_speed} km/h)")
+                    if low_visibility:
+                        alerts.append(f" ⚠️ Low Visibility ({slab.visibility_km} km)")
+                    lines.append(f"\t  {' | '.join(alerts)}")
         else:
-            print("\n\tNo meaningful precipitation slabs predicted.")
-        
+            lines.append("\n\tNo meaningful precipitation slabs predicted.")
+
         # Display production impact assessment
         impact_level, status_msg = get_production_status(day_summary['total_rain'], day_summary['slabs'])
-        print(f"\n\t• Rain Impact: {impact_level}")
-        print(f"\t• Production Status: {status_msg}")
-    
-    print(f"\n{'-'*60}")
+        lines.append(f"\n\t• Rain Impact: {impact_level}")
+        lines.append(f"\t• Production Status: {status_msg}")
+
+    lines.append(f"\n{'-'*60}")
+    return "\n".join(lines)
 
 
 def main():
@@ -611,8 +710,22 @@ def main():
     Entry point: iterate through all mine locations and fetch forecasts
     """
     print("Starting weather forecast retrieval for all mines...")
-    for mine in MINE_LOCATIONS:
-        fetch_and_print_forecast(mine["lat"], mine["lon"], mine["name"], mine["accuweather_location_key"])
+    # Open-Meteo accepts comma-separated coordinates, so one request covers
+    # every mine; the other providers are per-location only.
+    om_batch = fetch_open_meteo_batch([mine["lat"] for mine in MINE_LOCATIONS],
+                                      [mine["lon"] for mine in MINE_LOCATIONS])
+    # Mines are independent and I/O-bound, so run them concurrently; each
+    # worker returns its full report, printed in the original mine order.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(MINE_LOCATIONS))) as executor:
+        futures = [
+            executor.submit(fetch_and_print_forecast, mine["lat"], mine["lon"], mine["name"],
+                            mine["accuweather_location_key"],
+                            om_data=om_batch[i] if om_batch and i < len(om_batch) else None)
+            for i, mine in enumerate(MINE_LOCATIONS)
+        ]
+        reports = [future.result() for future in futures]
+    # One write for the whole run instead of a flush per report line
+    sys.stdout.write("\n".join(reports) + "\n")
     print("\nAll forecasts processed. Enjoy your day!")
 
 